@@ -196,14 +196,14 @@ def test_navigation():
         app = QApplication(sys.argv)
     
     try:
-        from configo_gui.ui.main_window import MainWindow
+        from configo_gui.ui.main_window import MainWindow, SCREEN_SPECS
         window = MainWindow()
         
         # Test navigation to different screens
         screens_to_test = ["welcome", "suggestions", "assistant", "console"]
         
         for screen in screens_to_test:
-            if screen in window.screens:
+            if screen in SCREEN_SPECS:
                 window.navigate_to_screen(screen)
                 current_widget = window.stacked_widget.currentWidget()
                 if current_widget == window.screens[screen]:
@@ -8,6 +8,7 @@ Test suite for the enhanced CONFIGO GUI components:
 - Predictive AI Suggestions
 - Enhanced Terminal Console
 - Main Window Integration
+- Memory export encoding
 
 Author: CONFIGO Team
 """
@@ -29,6 +30,7 @@ from configo_gui.ui.ai_assistant import AIAssistantPanel, ChatMessage
 from configo_gui.ui.predictive_suggestions import PredictiveSuggestionsPanel, ToolCard
 from configo_gui.ui.enhanced_terminal import EnhancedTerminalConsole, TimelineStep
 from configo_gui.ui.main_window import MainWindow
+from configo_gui.ui.memory_view import encode_session_history, decode_session_history
 
 
 class TestAIAssistant(unittest.TestCase):
@@ -198,9 +200,9 @@ class TestMainWindowIntegration(unittest.TestCase):
     def test_window_creation(self):
         """Test that Main Window can be created with new components."""
         self.assertIsNotNone(self.window)
-        self.assertIn("suggestions", self.window.screens)
-        self.assertIn("assistant", self.window.screens)
-        self.assertIn("console", self.window.screens)
+        self.assertIsNotNone(self.window.get_screen("suggestions"))
+        self.assertIsNotNone(self.window.get_screen("assistant"))
+        self.assertIsNotNone(self.window.get_screen("console"))
     
     def test_navigation(self):
         """Test navigation to new screens."""
@@ -294,6 +296,29 @@ class TestGUIAgent(unittest.TestCase):
         self.agent.log_command("invalid_command", 1)
 
 
+class TestMemoryExport(unittest.TestCase):
+    """Test session history encoding for memory exports."""
+    
+    def test_session_history_round_trip(self):
+        """Test that encoded session history decodes to the original entries."""
+        history = [
+            "Installed Python",
+            "Setup Django",
+            "Installed Python",
+            "Installed Python",
+        ]
+        
+        encoded = encode_session_history(history)
+        self.assertEqual(encoded["msgIndex"], ["Installed Python", "Setup Django"])
+        self.assertEqual(encoded["msgSequence"], [0, 1, 0, 0])
+        self.assertEqual(decode_session_history(encoded), history)
+    
+    def test_plain_session_history(self):
+        """Test that plain list exports are still accepted."""
+        history = ["Installed Python", "Setup Django"]
+        self.assertEqual(decode_session_history(history), history)
+
+
 def run_tests():
     """Run all tests."""
     # Create test suite
@@ -305,6 +330,7 @@ def run_tests():
     test_suite.addTest(unittest.makeSuite(TestEnhancedTerminal))
     test_suite.addTest(unittest.makeSuite(TestMainWindowIntegration))
     test_suite.addTest(unittest.makeSuite(TestGUIAgent))
+    test_suite.addTest(unittest.makeSuite(TestMemoryExport))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
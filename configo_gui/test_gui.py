@@ -103,6 +103,7 @@ def test_sample_data():
     try:
         from ui.memory_view import MemoryViewWidget
         from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import SIGNAL
         
         # Check if QApplication already exists
         app = QApplication.instance()
@@ -113,11 +114,18 @@ def test_sample_data():
         memory_widget = MemoryViewWidget()
         
         # Test that sample data was loaded
-        assert memory_widget.history_list.count() > 0
+        assert memory_widget.history_model.rowCount() > 0
         assert len(memory_widget.user_preferences) > 0
         assert len(memory_widget.tool_statistics) > 0
         print("✅ Sample data loading successful")
         
+        # Test that each button is connected to its handler exactly once
+        for button in (memory_widget.clear_history_button, memory_widget.export_history_button,
+                       memory_widget.add_pref_button, memory_widget.clear_memory_button,
+                       memory_widget.export_memory_button):
+            assert button.receivers(SIGNAL("clicked()")) == 1, button.text()
+        print("✅ Button connections successful")
+        
         # Clean up
         memory_widget.deleteLater()
         
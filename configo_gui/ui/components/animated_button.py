@@ -28,12 +28,13 @@ class AnimatedButton(QPushButton):
     """
     
     def __init__(self, text: str = "", variant: str = "primary", size: str = "medium",
-                 theme=None, parent=None):
+                 theme=None, parent=None, glow: bool = True):
         super().__init__(text, parent)
         
         self.theme = theme
         self.variant = variant
         self.size = size
+        self.glow = glow
         self.is_loading = False
         self.ripple_center = QPoint(0, 0)
         
@@ -59,17 +60,19 @@ class AnimatedButton(QPushButton):
         self.hover_animation.setDuration(200)
         self.hover_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         
-        # Glow effect animation
-        if not self.graphicsEffect():
-            glow_effect = QGraphicsDropShadowEffect()
-            glow_effect.setBlurRadius(20)
-            glow_effect.setOffset(0, 0)
-            glow_effect.setColor(QColor(0, 0, 0, 0))
-            self.setGraphicsEffect(glow_effect)
-        
-        self.glow_animation = QPropertyAnimation(self.graphicsEffect(), b"color")
-        self.glow_animation.setDuration(200)
-        self.glow_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        # Glow effect animation; the drop shadow renders the button offscreen
+        # on every repaint, so buttons that don't need depth can opt out
+        if self.glow:
+            if not self.graphicsEffect():
+                glow_effect = QGraphicsDropShadowEffect()
+                glow_effect.setBlurRadius(20)
+                glow_effect.setOffset(0, 0)
+                glow_effect.setColor(QColor(0, 0, 0, 0))
+                self.setGraphicsEffect(glow_effect)
+            
+            self.glow_animation = QPropertyAnimation(self.graphicsEffect(), b"color")
+            self.glow_animation.setDuration(200)
+            self.glow_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         
         # Ripple animation
         self.ripple_animation = QPropertyAnimation(self, b"geometry")
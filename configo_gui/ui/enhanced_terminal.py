@@ -327,6 +327,10 @@ class EnhancedTerminalConsole(QWidget):
         self.timeline_steps = []
         self.current_command = None
         self.command_history = []
+        
+        # Cursor holding the open edit block while a batch of output is added
+        self.batch_cursor = None
+        
         self.setup_ui()
         self.setup_connections()
         self.setup_styling()
@@ -587,6 +591,13 @@ class EnhancedTerminalConsole(QWidget):
             timestamp_str = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
             text = f"{timestamp_str} {text}"
         
+        # Within a batch, append through the cursor holding the edit block;
+        # the view is scrolled once when the batch ends
+        if self.batch_cursor is not None:
+            self.batch_cursor.movePosition(QTextCursor.End)
+            self.batch_cursor.insertText(text + "\n")
+            return
+        
         cursor = self.terminal_output.textCursor()
         cursor.movePosition(QTextCursor.End)
         self.terminal_output.setTextCursor(cursor)
@@ -597,6 +608,21 @@ class EnhancedTerminalConsole(QWidget):
             self.terminal_output.verticalScrollBar().maximum()
         )
     
+    def begin_batch(self):
+        """Suspend repaints and group edits while adding many lines of output."""
+        self.terminal_output.setUpdatesEnabled(False)
+        self.batch_cursor = self.terminal_output.textCursor()
+        self.batch_cursor.beginEditBlock()
+    
+    def end_batch(self):
+        """Finish a batch started with begin_batch and repaint once."""
+        self.batch_cursor.endEditBlock()
+        self.batch_cursor = None
+        self.terminal_output.setUpdatesEnabled(True)
+        self.terminal_output.verticalScrollBar().setValue(
+            self.terminal_output.verticalScrollBar().maximum()
+        )
+    
     def execute_command(self):
         """Execute the current command."""
         command = self.command_input.text().strip()
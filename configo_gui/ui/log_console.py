@@ -8,16 +8,83 @@ Displays real-time log messages with syntax highlighting and filtering.
 Author: CONFIGO Team
 """
 
+import re
+import time
+import queue
+from collections import Counter, deque
+from datetime import datetime
+from functools import partial
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QFrame, QTextEdit, QLineEdit,
     QComboBox, QCheckBox, QGroupBox, QSizePolicy,
-    QScrollArea, QSplitter, QMenu, QSpacerItem
+    QScrollArea, QSplitter, QMenu, QSpacerItem,
+    QFileDialog, QMessageBox
 )
 from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt, Signal, QTimer, QThread
+from PySide6.QtCore import Qt, Signal, QTimer, QThread, QCoreApplication
 from PySide6.QtGui import QFont, QTextCursor, QTextCharFormat, QColor, QSyntaxHighlighter, QTextDocument
 
+# Optional Aho-Corasick automaton for keyword classification
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Log level keywords in priority order; earlier levels win when a line
+# matches more than one level.
+LEVEL_KEYWORDS = {
+    'error': ('error', 'failed', 'exception', 'traceback'),
+    'success': ('success', 'installed', 'completed', 'done'),
+    'warning': ('warning', 'warn', 'deprecated'),
+    'info': ('info', 'installing', 'downloading'),
+}
+LEVEL_PRIORITY = {level: priority for priority, level in enumerate(LEVEL_KEYWORDS)}
+
+
+def build_level_automaton():
+    """Build an Aho-Corasick automaton mapping each keyword to (priority, level)."""
+    automaton = ahocorasick.Automaton()
+    for level, keywords in LEVEL_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (LEVEL_PRIORITY[level], level))
+    automaton.make_automaton()
+    return automaton
+
+
+LEVEL_AUTOMATON = build_level_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def text_mask(text: str) -> int:
+    """
+    Build a 64-bit character-presence mask for text.
+    
+    A message can only contain a filter string if its mask covers every bit
+    of the filter's mask, which lets filtering reject most non-matching
+    messages before doing the real substring search.
+    """
+    mask = 0
+    for byte in set(text.encode('utf-8')):
+        mask |= 1 << (byte & 63)
+    return mask
+
+
+class LogEntry:
+    """A single stored log message with its precomputed filter data."""
+    
+    __slots__ = ('message', 'message_lower', 'mask', 'level', 'raw_message', 'state')
+    
+    def __init__(self, message: str, level: str, raw_message: str, state: int):
+        self.message = message
+        self.message_lower = message.lower()
+        self.mask = text_mask(self.message_lower)
+        self.level = level
+        self.raw_message = raw_message
+        self.state = state
+
 
 class LogHighlighter(QSyntaxHighlighter):
     """
@@ -31,6 +98,21 @@ class LogHighlighter(QSyntaxHighlighter):
     - Timestamps in gray
     """
     
+    # Fallback classifier used when pyahocorasick isn't installed
+    LEVEL_PATTERN = re.compile(
+        "|".join(
+            f"(?P<{level}>{'|'.join(keywords)})"
+            for level, keywords in LEVEL_KEYWORDS.items()
+        ),
+        re.IGNORECASE,
+    )
+    LEVEL_PRIORITY = LEVEL_PRIORITY
+    
+    # Block user states used to tag lines with their level at insertion time
+    # so highlightBlock does not have to rescan text on every repaint.
+    LEVEL_STATES = {'plain': 0, 'error': 1, 'success': 2, 'warning': 3, 'info': 4}
+    STATE_LEVELS = {state: level for level, state in LEVEL_STATES.items()}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_formats()
@@ -67,24 +149,150 @@ class LogHighlighter(QSyntaxHighlighter):
     
     def highlightBlock(self, text):
         """Highlight a block of text based on log level."""
-        # Check for error messages
-        if any(keyword in text.lower() for keyword in ['error', 'failed', 'exception', 'traceback']):
-            self.setFormat(0, len(text), self.formats['error'])
-        # Check for success messages
-        elif any(keyword in text.lower() for keyword in ['success', 'installed', 'completed', 'done']):
-            self.setFormat(0, len(text), self.formats['success'])
-        # Check for warning messages
-        elif any(keyword in text.lower() for keyword in ['warning', 'warn', 'deprecated']):
-            self.setFormat(0, len(text), self.formats['warning'])
-        # Check for info messages
-        elif any(keyword in text.lower() for keyword in ['info', 'installing', 'downloading']):
-            self.setFormat(0, len(text), self.formats['info'])
+        state = self.currentBlockState()
+        if state < 0:
+            # Untagged block, fall back to scanning the text
+            state = self.block_state(text)
+        
+        level = self.STATE_LEVELS.get(state, 'plain')
+        if level != 'plain':
+            self.setFormat(0, len(text), self.formats[level])
         # Check for timestamps
         elif text.strip().startswith('[') and ']' in text:
             # Highlight timestamp part
             end_bracket = text.find(']')
             if end_bracket > 0:
                 self.setFormat(0, end_bracket + 1, self.formats['timestamp'])
+    
+    @classmethod
+    def classify(cls, text: str):
+        """Return the highest-priority log level keyword found in text, or None."""
+        best = None
+        
+        if LEVEL_AUTOMATON is not None:
+            # Single linear scan over the text for all keywords
+            for _, (priority, level) in LEVEL_AUTOMATON.iter(text.lower()):
+                if best is None or priority < best[0]:
+                    best = (priority, level)
+                    if priority == 0:
+                        break
+            return best[1] if best else None
+        
+        for match in cls.LEVEL_PATTERN.finditer(text):
+            level = match.lastgroup
+            if best is None or cls.LEVEL_PRIORITY[level] < cls.LEVEL_PRIORITY[best]:
+                best = level
+                if cls.LEVEL_PRIORITY[best] == 0:
+                    break
+        return best
+    
+    @classmethod
+    def block_state(cls, text: str) -> int:
+        """Return the block user state for a line of log text."""
+        return cls.LEVEL_STATES[cls.classify(text) or 'plain']
+
+
+class LogIngestWorker(QThread):
+    """
+    Worker thread for preparing incoming log messages.
+    
+    Formats, classifies and indexes posted messages off the UI thread and
+    emits them in batches, so the console only has to insert the text.
+    """
+    
+    # Signals
+    entries_ready = Signal(list)  # list of LogEntry
+    
+    # Seconds to collect messages before emitting a batch
+    FLUSH_INTERVAL = 0.1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pending = queue.Queue()
+        self.is_running = True
+    
+    def post(self, message: str, level: str):
+        """Queue a raw log message; safe to call from any thread."""
+        self.pending.put((datetime.now(), message, level))
+    
+    def run(self):
+        """Collect posted messages and emit them as prepared batches."""
+        while self.is_running:
+            item = self.pending.get()
+            if item is None:
+                break
+            
+            batch = [self.create_entry(*item)]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.is_running = False
+                    break
+                batch.append(self.create_entry(*item))
+            
+            self.entries_ready.emit(batch)
+    
+    def create_entry(self, when: datetime, message: str, level: str) -> LogEntry:
+        """Build a log entry for a raw message."""
+        timestamp = when.strftime("[%H:%M:%S]")
+        formatted_message = f"{timestamp} [{level.upper()}] {message}"
+        
+        # Color by the level the message was logged with; only unknown levels
+        # fall back to scanning the text for keywords
+        state = LogHighlighter.LEVEL_STATES.get(level.lower())
+        if state is None:
+            state = LogHighlighter.block_state(formatted_message)
+        return LogEntry(formatted_message, level, message, state)
+    
+    def stop(self):
+        """Stop the worker and wait for it to exit; safe to call repeatedly."""
+        if not self.isRunning():
+            return
+        self.is_running = False
+        # Wake the worker if it is blocked waiting for messages
+        self.pending.put(None)
+        self.wait()
+
+
+class LogExportWorker(QThread):
+    """
+    Worker thread for exporting log messages to a file.
+    
+    Writes a snapshot of the messages in the background so large logs
+    don't block the GUI.
+    """
+    
+    # Signals
+    export_finished = Signal(str)  # file_path
+    export_failed = Signal(str)  # error message
+    
+    # Messages encoded per write; keeps the temporary buffer small for huge logs
+    CHUNK_SIZE = 10000
+    
+    def __init__(self, messages: list, file_path: str):
+        super().__init__()
+        self.messages = messages
+        self.file_path = file_path
+    
+    def run(self):
+        """Write the messages to the export file."""
+        try:
+            with open(self.file_path, 'wb') as f:
+                for start in range(0, len(self.messages), self.CHUNK_SIZE):
+                    chunk = self.messages[start:start + self.CHUNK_SIZE]
+                    f.write(("\n".join(chunk) + "\n").encode('utf-8'))
+            
+            self.export_finished.emit(self.file_path)
+            
+        except Exception as e:
+            self.export_failed.emit(str(e))
 
 
 class LogConsoleWidget(QWidget):
@@ -103,12 +311,40 @@ class LogConsoleWidget(QWidget):
     # Signals
     log_cleared = Signal()  # Emitted when logs are cleared
     
+    # Oldest messages are dropped once this many are stored
+    MAX_LOG_MESSAGES = 10000
+    
     def __init__(self):
         super().__init__()
-        self.log_messages = []
+        self.log_messages = deque(maxlen=self.MAX_LOG_MESSAGES)
+        self.level_counts = Counter()
+        self.export_worker = None
+        
+        # Active text filter, lowercased, and its character mask; updated when
+        # the debounced filter is applied rather than per checked entry
+        self.filter_text = ""
+        self.filter_mask = 0
+        
+        # Debounce filter changes so typing doesn't rebuild the view per keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.refresh_display)
+        
         self.setup_ui()
-        self.setup_connections()
         self.setup_styling()
+        
+        # Prepare incoming messages on a worker thread; batches are delivered
+        # back to the UI thread for insertion
+        self.ingest_worker = LogIngestWorker(self)
+        self.ingest_worker.entries_ready.connect(self.append_batch, Qt.QueuedConnection)
+        
+        # The worker is owned by this widget and must be stopped before Qt
+        # deletes it with its children. Bind the stop to the worker itself,
+        # since this widget's Python side is gone by the time destroyed fires.
+        self.destroyed.connect(partial(LogIngestWorker.stop, self.ingest_worker))
+        QCoreApplication.instance().aboutToQuit.connect(self.shutdown)
+        self.ingest_worker.start()
     
     def setup_ui(self):
         """Initialize the log console UI components."""
@@ -230,6 +466,13 @@ class LogConsoleWidget(QWidget):
         self.log_text.setReadOnly(True)
         self.log_text.setLineWrapMode(QTextEdit.NoWrap)
         
+        # The view is read-only, so don't keep undo history for every insert.
+        # Cap the block count to match the stored messages (plus the trailing
+        # empty block) so the document can't outgrow the ring buffer.
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.document().setUndoRedoEnabled(False)
+        self.log_text.document().setMaximumBlockCount(self.MAX_LOG_MESSAGES + 1)
+        
         # Set monospace font
         font = QFont("Consolas", 10)
         self.log_text.setFont(font)
@@ -237,24 +480,15 @@ class LogConsoleWidget(QWidget):
         # Apply syntax highlighter
         self.highlighter = LogHighlighter(self.log_text.document())
         
+        # Persistent cursor at the end of the document; log lines are only ever
+        # appended, so it stays at the end after each insert
+        self.end_cursor = QTextCursor(self.log_text.document())
+        self.end_cursor.movePosition(QTextCursor.End)
+        
         log_layout.addWidget(self.log_text)
         
         main_layout.addWidget(log_group)
     
-    def setup_connections(self):
-        """Setup signal connections."""
-        # Connect filter input
-        self.filter_input.textChanged.connect(self.on_filter_changed)
-        
-        # Connect level combo
-        self.level_combo.currentTextChanged.connect(self.on_level_changed)
-        
-        # Connect clear button
-        self.clear_button.clicked.connect(self.on_clear_clicked)
-        
-        # Connect export button
-        self.export_button.clicked.connect(self.on_export_clicked)
-    
     def setup_styling(self):
         """Apply custom styling to the log console widget."""
         self.setStyleSheet("""
@@ -357,74 +591,114 @@ class LogConsoleWidget(QWidget):
         """)
     
     def add_log_message(self, message: str, level: str = "info"):
-        """Add a log message to the console."""
-        from datetime import datetime
-        
-        # Create timestamp
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        
-        # Create formatted message
-        formatted_message = f"{timestamp} [{level.upper()}] {message}"
-        
-        # Add to internal list
-        self.log_messages.append({
-            'message': formatted_message,
-            'level': level,
-            'raw_message': message
-        })
+        """
+        Add a log message to the console.
+        
+        The message is prepared on the ingest worker and shown with the next
+        batch, so the display and get_log_count() lag by up to one
+        LogIngestWorker.FLUSH_INTERVAL (100 ms).
+        """
+        self.ingest_worker.post(message, level)
+    
+    def append_batch(self, entries: list):
+        """Store a batch of prepared log entries and display those that match."""
+        for log_entry in entries:
+            if len(self.log_messages) == self.log_messages.maxlen:
+                # The deque is about to drop its oldest entry
+                self.level_counts[self.log_messages[0].level] -= 1
+            self.log_messages.append(log_entry)
+            self.level_counts[log_entry.level] += 1
         
         # Apply filters
-        if self.should_display_message(formatted_message, level):
-            # Add to text widget
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.log_text.setTextCursor(cursor)
-            self.log_text.insertPlainText(formatted_message + "\n")
-            
-            # Auto-scroll if enabled
-            if self.auto_scroll_check.isChecked():
-                self.log_text.ensureCursorVisible()
+        visible = [log_entry for log_entry in entries if self.should_display_message(log_entry)]
+        if not visible:
+            return
+        
+        # Insert as a single edit so the highlighter runs once for the batch
+        self.end_cursor.beginEditBlock()
+        try:
+            for log_entry in visible:
+                self.append_entry(log_entry)
+        finally:
+            self.end_cursor.endEditBlock()
+        
+        # Auto-scroll if enabled
+        if self.auto_scroll_check.isChecked():
+            self.log_text.setTextCursor(self.end_cursor)
+            self.log_text.ensureCursorVisible()
     
-    def should_display_message(self, message: str, level: str) -> bool:
-        """Check if message should be displayed based on current filters."""
+    def should_display_message(self, log_entry: LogEntry) -> bool:
+        """Check if a log entry should be displayed based on current filters."""
         # Check level filter
         current_level = self.level_combo.currentText()
-        if current_level != "All" and level.lower() != current_level.lower():
+        if current_level != "All" and log_entry.level.lower() != current_level.lower():
             return False
         
-        # Check text filter
-        filter_text = self.filter_input.text().lower()
-        if filter_text and filter_text not in message.lower():
-            return False
+        # Check text filter against the lowercase copy made at insertion
+        if self.filter_text:
+            if (log_entry.mask & self.filter_mask) != self.filter_mask:
+                return False
+            if self.filter_text not in log_entry.message_lower:
+                return False
         
         return True
     
     def on_filter_changed(self):
         """Handle filter text changes."""
-        self.refresh_display()
+        self.filter_timer.start()
     
     def on_level_changed(self):
         """Handle log level filter changes."""
-        self.refresh_display()
+        self.filter_timer.start()
     
     def refresh_display(self):
         """Refresh the log display based on current filters."""
-        self.log_text.clear()
-        
-        for log_entry in self.log_messages:
-            if self.should_display_message(log_entry['message'], log_entry['level']):
-                self.log_text.append(log_entry['message'])
+        self.filter_text = filter_text = self.filter_input.text().lower()
+        self.filter_mask = filter_mask = text_mask(filter_text)
+        current_level = self.level_combo.currentText().lower()
+        
+        entries = [
+            log_entry for log_entry in self.log_messages
+            if (current_level == 'all' or log_entry.level.lower() == current_level)
+            and (log_entry.mask & filter_mask) == filter_mask
+            and (not filter_text or filter_text in log_entry.message_lower)
+        ]
+        
+        # Detach the highlighter while rebuilding so lines aren't highlighted
+        # one by one; reattaching rehighlights the whole document in one pass
+        document = self.log_text.document()
+        self.highlighter.setDocument(None)
+        try:
+            # Replace the document contents in one go instead of appending per line
+            text = "\n".join(log_entry.message for log_entry in entries)
+            self.log_text.setPlainText(text + "\n" if entries else "")
+            
+            # Restore the level tags on the rebuilt blocks
+            block = document.firstBlock()
+            for log_entry in entries:
+                block.setUserState(log_entry.state)
+                block = block.next()
+        finally:
+            self.highlighter.setDocument(document)
+        
+        self.end_cursor.movePosition(QTextCursor.End)
+    
+    def append_entry(self, log_entry: LogEntry):
+        """Append a log entry to the end of the text widget, tagged with its level."""
+        # Tag the block before inserting so the highlighter sees the state
+        self.end_cursor.block().setUserState(log_entry.state)
+        self.end_cursor.insertText(log_entry.message + "\n")
     
     def on_clear_clicked(self):
         """Handle clear button click."""
         self.log_messages.clear()
+        self.level_counts.clear()
         self.log_text.clear()
+        self.end_cursor.movePosition(QTextCursor.End)
         self.log_cleared.emit()
     
     def on_export_clicked(self):
         """Handle export button click."""
-        from PySide6.QtWidgets import QFileDialog
-        
         # Get save file path
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -434,24 +708,40 @@ class LogConsoleWidget(QWidget):
         )
         
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    for log_entry in self.log_messages:
-                        f.write(log_entry['message'] + '\n')
-                
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.information(
-                    self,
-                    "Export Successful",
-                    f"Logs exported to: {file_path}"
-                )
-            except Exception as e:
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.critical(
-                    self,
-                    "Export Failed",
-                    f"Failed to export logs: {str(e)}"
-                )
+            # Snapshot the messages so the worker isn't affected by new logs
+            messages = [log_entry.message for log_entry in self.log_messages]
+            
+            self.export_button.setEnabled(False)
+            self.export_worker = LogExportWorker(messages, file_path)
+            self.export_worker.export_finished.connect(self.on_export_finished)
+            self.export_worker.export_failed.connect(self.on_export_failed)
+            self.export_worker.finished.connect(lambda: self.export_button.setEnabled(True))
+            self.export_worker.start()
+    
+    def on_export_finished(self, file_path: str):
+        """Handle successful log export."""
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Logs exported to: {file_path}"
+        )
+    
+    def on_export_failed(self, error: str):
+        """Handle failed log export."""
+        QMessageBox.critical(
+            self,
+            "Export Failed",
+            f"Failed to export logs: {error}"
+        )
+    
+    def shutdown(self):
+        """
+        Stop the ingest worker; messages added afterwards are not shown.
+        
+        Called when the application quits. Closing or hiding the console
+        leaves the worker running so it keeps receiving messages.
+        """
+        self.ingest_worker.stop()
     
     def get_log_count(self) -> int:
         """Get the total number of log messages."""
@@ -459,8 +749,8 @@ class LogConsoleWidget(QWidget):
     
     def get_error_count(self) -> int:
         """Get the number of error messages."""
-        return len([log for log in self.log_messages if log['level'] == 'error'])
+        return self.level_counts['error']
     
     def get_warning_count(self) -> int:
         """Get the number of warning messages."""
-        return len([log for log in self.log_messages if log['level'] == 'warning']) 
\ No newline at end of file
+        return self.level_counts['warning'] 
\ No newline at end of file
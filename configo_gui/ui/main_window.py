@@ -9,35 +9,214 @@ Author: CONFIGO Team
 """
 
 import sys
+from collections import deque
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QStackedWidget, QLabel, QPushButton, QFrame,
-    QSizePolicy, QSpacerItem, QScrollArea, QTextEdit,
-    QLineEdit, QProgressBar, QGroupBox, QGridLayout,
-    QListWidget, QListWidgetItem, QTabWidget, QSplitter,
-    QMessageBox, QDialog, QDialogButtonBox
+    QSizePolicy, QSpacerItem, QMessageBox, QButtonGroup,
+    QApplication, QStatusBar, QDialog, QListWidget, QDialogButtonBox, QStyle
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve, QThread
-from PySide6.QtGui import QFont, QIcon, QPixmap, QPalette, QColor
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QTimer, QThread, QCoreApplication, QSize
 
 # Import GUI components
 from .welcome_screen import WelcomeScreen
 from .environment_setup import EnvironmentSetupScreen
 from .plan_renderer import PlanRendererScreen
-from .log_console import LogConsoleWidget
 from .portal_integration import PortalIntegrationWidget
 from .memory_view import MemoryViewWidget
-from .error_handler import ErrorHandlerWidget
 from .ai_assistant import AIAssistantPanel
 from .predictive_suggestions import PredictiveSuggestionsPanel
 from .enhanced_terminal import EnhancedTerminalConsole
 
-# Import backend wrapper
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from configo_gui.configo_core.gui_agent import ConfigoGUIAgent
+# Import backend wrapper; the repository root is only added to sys.path when
+# this module was loaded without it, e.g. as the top-level ui package
+try:
+    from configo_gui.configo_core.gui_agent import ConfigoGUIAgent
+except ImportError:
+    root = str(Path(__file__).parent.parent.parent)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    from configo_gui.configo_core.gui_agent import ConfigoGUIAgent
+
+
+# Main window stylesheet, built once at import and set on the window itself
+# so it doesn't leak into other top-level windows
+MAIN_WINDOW_STYLESHEET = """
+    MainWindow {
+        background-color: #2b2b2b;
+    }
+    
+    MainWindow #sidebar {
+        background-color: #1e1e1e;
+        border-right: 1px solid #404040;
+    }
+    
+    MainWindow #content-frame {
+        background-color: #2b2b2b;
+    }
+    
+    MainWindow #logo-label {
+        color: #ffffff;
+        font-size: 24px;
+        font-weight: bold;
+        padding: 20px;
+    }
+    
+    MainWindow QPushButton {
+        background-color: #404040;
+        border: none;
+        border-radius: 8px;
+        padding: 12px 16px;
+        color: #ffffff;
+        font-size: 14px;
+        text-align: left;
+    }
+    
+    MainWindow QPushButton:hover {
+        background-color: #505050;
+    }
+    
+    MainWindow QPushButton:checked {
+        background-color: #0066cc;
+    }
+    
+    MainWindow QPushButton:pressed {
+        background-color: #0052a3;
+    }
+"""
+
+
+# Sidebar navigation entries: (screen id, button label, button object name,
+# standard icon)
+NAV_ITEMS = tuple(
+    (screen_id, text, f"nav-{screen_id}", icon)
+    for icon, text, screen_id in (
+        (QStyle.SP_DirHomeIcon, "Welcome", "welcome"),
+        (QStyle.SP_MessageBoxInformation, "AI Suggestions", "suggestions"),
+        (QStyle.SP_DialogHelpButton, "AI Assistant", "assistant"),
+        (QStyle.SP_ComputerIcon, "Environment Setup", "setup"),
+        (QStyle.SP_FileDialogDetailedView, "Plan", "plan"),
+        (QStyle.SP_CommandLink, "Enhanced Console", "console"),
+        (QStyle.SP_DriveNetIcon, "Portals", "portals"),
+        (QStyle.SP_DriveHDIcon, "Memory", "memory"),
+    )
+)
+NAV_SCREEN_IDS = {nav_id: screen_id for nav_id, (screen_id, _, _, _) in enumerate(NAV_ITEMS)}
+
+# Size of the sidebar navigation icons
+NAV_ICON_SIZE = QSize(20, 20)
+
+# Screen registry: screen id -> (factory, [(screen signal, MainWindow slot), ...])
+SCREEN_SPECS = {
+    "welcome": (WelcomeScreen, [("start_clicked", "on_start_clicked")]),
+    "setup": (EnvironmentSetupScreen, [("environment_requested", "on_environment_requested")]),
+    "plan": (PlanRendererScreen, []),
+    "suggestions": (PredictiveSuggestionsPanel, [
+        ("tool_selected", "on_tool_selected"),
+        ("profile_updated", "on_profile_updated"),
+    ]),
+    "assistant": (AIAssistantPanel, [("message_sent", "on_ai_message_sent")]),
+    "console": (EnhancedTerminalConsole, [
+        ("step_completed", "on_step_completed"),
+        ("command_executed", "on_command_executed"),
+    ]),
+    "portals": (PortalIntegrationWidget, []),
+    "memory": (MemoryViewWidget, []),
+}
+
+
+class ScreenCache(dict):
+    """
+    Screens by id, built on first lookup.
+    
+    Indexing any id in SCREEN_SPECS creates the screen if needed. Membership,
+    len() and keys() only cover screens that have been created; check
+    SCREEN_SPECS to test whether a screen id exists.
+    """
+    
+    def __init__(self, create_screen):
+        super().__init__()
+        self.create_screen = create_screen
+    
+    def __missing__(self, screen_id):
+        if screen_id not in SCREEN_SPECS:
+            raise KeyError(screen_id)
+        return self.create_screen(screen_id)
+
+
+def stop_thread(thread: QThread):
+    """Quit a worker thread and wait for it to finish."""
+    thread.quit()
+    thread.wait()
+
+
+class ChatWorker(QObject):
+    """
+    Worker object for AI assistant chat requests.
+    
+    Lives on its own thread so waiting for the chat agent never blocks the GUI.
+    """
+    
+    # Signals
+    response_ready = Signal(str)  # Emitted with the agent's reply
+    
+    def __init__(self, gui_agent: Optional[ConfigoGUIAgent] = None):
+        super().__init__()
+        self.gui_agent = gui_agent
+    
+    @Slot(str)
+    def handle_message(self, message: str):
+        """Send a message to the chat agent and emit its response."""
+        self.response_ready.emit(self.gui_agent.chat_with_agent(message))
+
+
+class AgentLoader(QObject):
+    """
+    Worker object that constructs the GUI agent off the UI thread.
+    
+    Backend initialization can be slow, so the window is shown first and the
+    agent is handed over through agent_ready once it exists.
+    """
+    
+    # Signals
+    agent_ready = Signal(object)  # Emitted with the constructed ConfigoGUIAgent
+    
+    @Slot()
+    def load(self):
+        """Create the GUI agent and hand it over to the GUI thread."""
+        try:
+            agent = ConfigoGUIAgent()
+            agent.moveToThread(QCoreApplication.instance().thread())
+            self.agent_ready.emit(agent)
+        finally:
+            # The thread has no more work once the agent exists
+            QThread.currentThread().quit()
+
+
+class AgentCleanup(QObject):
+    """
+    Worker object that runs the GUI agent cleanup off the UI thread.
+    
+    Cleanup waits for running installations and saves memory, so the window
+    stays responsive while it shuts down.
+    """
+    
+    # Signals
+    cleanup_finished = Signal()
+    
+    def __init__(self, gui_agent: ConfigoGUIAgent):
+        super().__init__()
+        self.gui_agent = gui_agent
+    
+    @Slot()
+    def run(self):
+        """Clean up the GUI agent and report completion."""
+        self.gui_agent.cleanup()
+        self.cleanup_finished.emit()
 
 
 class MainWindow(QMainWindow):
@@ -54,27 +233,64 @@ class MainWindow(QMainWindow):
     - Error handling with modals
     """
     
-    # Signals for communication with backend
-    environment_requested = Signal(str)  # Emitted when user requests environment setup
-    plan_generated = Signal(list)  # Emitted when plan is generated
-    installation_started = Signal()  # Emitted when installation begins
-    installation_finished = Signal(bool, str)  # Emitted when installation completes (success, message)
-    log_updated = Signal(str)  # Emitted when new log message is available
-    error_occurred = Signal(str)  # Emitted when an error occurs
+    # Signals
+    chat_requested = Signal(str)  # Emitted to send a message to the chat worker
+    
+    # Screens that can't be used until the backend agent has loaded
+    AGENT_SCREENS = ("suggestions", "assistant", "setup")
+    
+    # Screens cached on an attribute when created
+    SCREEN_ATTRIBUTES = {
+        "console": "console_screen",
+        "assistant": "assistant_screen",
+        "plan": "plan_screen",
+    }
+    
+    # Navigation icons by screen id, loaded on first use and shared by all windows
+    nav_icons = None
     
     def __init__(self):
         super().__init__()
         
-        # Initialize backend agent
-        self.gui_agent = ConfigoGUIAgent()
+        # Backend agent is loaded in the background; actions that need it
+        # before it is ready are queued and replayed
+        self.gui_agent = None
+        self.pending_actions = []
+        
+        # Message boxes are created once and reused for repeated messages
+        self.message_boxes = {}
+        
+        # Backend errors are collected here and listed on demand
+        self.error_log = []
+        self.error_dialog = None
+        
+        # Shutdown state: cleanup runs in the background before the window closes
+        self.closing = False
+        self.cleanup_done = False
+        
+        # Worker threads; the agent thread is started by load_agent and the
+        # chat thread on the first chat request
+        self.agent_thread = None
+        self.chat_thread = None
+        self.chat_worker = ChatWorker()
+        self.cleanup_thread = None
+        
+        # Coalesce backend log lines and flush them to the console at ~60 Hz
+        self.log_buffer = deque()
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(16)
+        self.log_flush_timer.timeout.connect(self.flush_logs)
         
         # Setup UI
         self.setup_ui()
-        self.setup_connections()
         self.setup_styling()
         
         # Show welcome screen
         self.show_welcome_screen()
+        
+        # Initialize backend agent
+        self.load_agent()
     
     def setup_ui(self):
         """Initialize the main window UI components."""
@@ -98,9 +314,23 @@ class MainWindow(QMainWindow):
         # Create main content area
         self.setup_main_content(main_layout)
         
+        # Status bar for transient notices such as backend errors
+        self.setStatusBar(QStatusBar(self))
+        
         # Create stacked widget for different screens
         self.setup_stacked_widget()
     
+    @classmethod
+    def load_nav_icons(cls) -> dict:
+        """Return the shared navigation icons, loading them on first call."""
+        if cls.nav_icons is None:
+            style = QApplication.style()
+            cls.nav_icons = {
+                screen_id: style.standardIcon(icon)
+                for screen_id, _, _, icon in NAV_ITEMS
+            }
+        return cls.nav_icons
+    
     def setup_sidebar(self, main_layout):
         """Create the sidebar navigation."""
         # Sidebar container
@@ -121,32 +351,37 @@ class MainWindow(QMainWindow):
         logo_label.setAlignment(Qt.AlignCenter)
         sidebar_layout.addWidget(logo_label)
         
-        # Navigation buttons
+        # Navigation buttons, routed through one exclusive button group
         self.nav_buttons = {}
-        
-        nav_items = [
-            ("🏠", "Welcome", "welcome"),
-            ("🧠", "AI Suggestions", "suggestions"),
-            ("🤖", "AI Assistant", "assistant"),
-            ("⚙️", "Environment Setup", "setup"),
-            ("📋", "Plan", "plan"),
-            ("🖥️", "Enhanced Console", "console"),
-            ("🌐", "Portals", "portals"),
-            ("💾", "Memory", "memory"),
-        ]
-        
-        for icon, text, screen_id in nav_items:
-            btn = QPushButton(f"{icon} {text}")
-            btn.setObjectName(f"nav-{screen_id}")
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        
+        nav_icons = self.load_nav_icons()
+        for nav_id, (screen_id, label, object_name, _) in enumerate(NAV_ITEMS):
+            btn = QPushButton(nav_icons[screen_id], label)
+            btn.setIconSize(NAV_ICON_SIZE)
+            btn.setObjectName(object_name)
             btn.setCheckable(True)
-            btn.clicked.connect(lambda checked, sid=screen_id: self.navigate_to_screen(sid))
+            self.nav_group.addButton(btn, nav_id)
             self.nav_buttons[screen_id] = btn
             sidebar_layout.addWidget(btn)
         
+        self.nav_screen_ids = NAV_SCREEN_IDS
+        self.nav_group.idClicked.connect(self.on_nav_clicked)
+        
         # Add spacer at bottom
         spacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
         sidebar_layout.addItem(spacer)
         
+        # Errors button opens the collected error log
+        self.errors_button = QPushButton(
+            self.style().standardIcon(QStyle.SP_MessageBoxWarning), "Errors (0)"
+        )
+        self.errors_button.setIconSize(NAV_ICON_SIZE)
+        self.errors_button.setObjectName("errors-button")
+        self.errors_button.clicked.connect(self.show_error_log)
+        sidebar_layout.addWidget(self.errors_button)
+        
         # Add sidebar to main layout
         main_layout.addWidget(sidebar)
     
@@ -170,223 +405,354 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.content_layout.addWidget(self.stacked_widget)
         
-        # Create different screens
-        self.screens = {}
+        # Screens are created on first use; only the welcome screen is built up front
+        self.screens = ScreenCache(self.get_screen)
+        self.screen_indices = {}
         
-        # Welcome screen
-        self.screens["welcome"] = WelcomeScreen()
-        self.screens["welcome"].start_clicked.connect(self.on_start_clicked)
-        self.stacked_widget.addWidget(self.screens["welcome"])
+        # Direct references to the screens used by the hot handlers, set on creation
+        self.console_screen = None
+        self.assistant_screen = None
+        self.plan_screen = None
         
-        # Environment setup screen
-        self.screens["setup"] = EnvironmentSetupScreen()
-        self.screens["setup"].environment_requested.connect(self.on_environment_requested)
-        self.stacked_widget.addWidget(self.screens["setup"])
-        
-        # Plan renderer screen
-        self.screens["plan"] = PlanRendererScreen()
-        self.stacked_widget.addWidget(self.screens["plan"])
-        
-        # AI Suggestions screen
-        self.screens["suggestions"] = PredictiveSuggestionsPanel()
-        self.screens["suggestions"].tool_selected.connect(self.on_tool_selected)
-        self.screens["suggestions"].profile_updated.connect(self.on_profile_updated)
-        self.stacked_widget.addWidget(self.screens["suggestions"])
+        self.get_screen("welcome")
+    
+    def get_screen(self, screen_id: str) -> QWidget:
+        """Return the screen for screen_id, creating it on first access."""
+        screen = self.screens.get(screen_id)
+        if screen is None:
+            factory, wiring = SCREEN_SPECS[screen_id]
+            screen = factory()
+            for signal_name, slot_name in wiring:
+                getattr(screen, signal_name).connect(getattr(self, slot_name))
+            self.screen_indices[screen_id] = self.stacked_widget.addWidget(screen)
+            self.screens[screen_id] = screen
+            
+            attribute = self.SCREEN_ATTRIBUTES.get(screen_id)
+            if attribute:
+                setattr(self, attribute, screen)
+        return screen
+    
+    def start_worker_thread(self, thread: QThread):
+        """Start a worker thread that is stopped before this window is destroyed."""
+        # Bind the thread itself, not a method of this window, so the stop
+        # still runs after the Python side of the window is gone
+        self.destroyed.connect(partial(stop_thread, thread))
+        thread.start()
+    
+    def start_chat_thread(self):
+        """Start the chat worker thread if it isn't running yet."""
+        if self.chat_thread is None:
+            self.chat_thread = QThread(self)
+            self.chat_worker.moveToThread(self.chat_thread)
+            self.start_worker_thread(self.chat_thread)
+    
+    def load_agent(self):
+        """Start constructing the backend agent on a worker thread."""
+        for screen_id in self.AGENT_SCREENS:
+            self.nav_buttons[screen_id].setEnabled(False)
+        
+        self.agent_thread = QThread(self)
+        self.agent_loader = AgentLoader()
+        self.agent_loader.moveToThread(self.agent_thread)
+        self.agent_thread.started.connect(self.agent_loader.load)
+        self.agent_loader.agent_ready.connect(self.on_agent_ready, Qt.QueuedConnection)
+        self.start_worker_thread(self.agent_thread)
+    
+    @Slot(object)
+    def on_agent_ready(self, agent: ConfigoGUIAgent):
+        """Handle the backend agent finishing construction."""
+        self.gui_agent = agent
         
-        # AI Assistant screen
-        self.screens["assistant"] = AIAssistantPanel()
-        self.screens["assistant"].message_sent.connect(self.on_ai_message_sent)
-        self.stacked_widget.addWidget(self.screens["assistant"])
+        # Keep the agent for cleanup, but don't wire up a closing window
+        if self.closing:
+            return
         
-        # Enhanced console screen
-        self.screens["console"] = EnhancedTerminalConsole()
-        self.screens["console"].step_completed.connect(self.on_step_completed)
-        self.screens["console"].command_executed.connect(self.on_command_executed)
-        self.stacked_widget.addWidget(self.screens["console"])
+        self.chat_worker.gui_agent = agent
+        self.setup_connections()
         
-        # Portal integration screen
-        self.screens["portals"] = PortalIntegrationWidget()
-        self.stacked_widget.addWidget(self.screens["portals"])
+        for screen_id in self.AGENT_SCREENS:
+            self.nav_buttons[screen_id].setEnabled(True)
         
-        # Memory view screen
-        self.screens["memory"] = MemoryViewWidget()
-        self.stacked_widget.addWidget(self.screens["memory"])
+        # Replay actions requested while the agent was loading
+        pending_actions, self.pending_actions = self.pending_actions, []
+        for action in pending_actions:
+            action(agent)
+    
+    def run_with_agent(self, action):
+        """Run action(gui_agent) now, or once the agent has finished loading."""
+        if self.gui_agent is None:
+            self.pending_actions.append(action)
+        else:
+            action(self.gui_agent)
     
     def setup_connections(self):
         """Setup signal connections between components."""
-        # Connect backend signals to UI updates
-        self.gui_agent.plan_generated.connect(self.on_plan_generated)
-        self.gui_agent.installation_progress.connect(self.on_installation_progress)
-        self.gui_agent.installation_finished.connect(self.on_installation_finished)
-        self.gui_agent.log_message.connect(self.on_log_message)
-        self.gui_agent.error_occurred.connect(self.on_error_occurred)
-        
-        # Connect UI signals to backend
-        self.environment_requested.connect(self.gui_agent.setup_environment)
-        self.installation_started.connect(self.gui_agent.start_installation)
+        # Connect backend signals to UI updates; the backend may emit from
+        # worker threads, so always deliver through the UI event loop
+        self.gui_agent.plan_generated.connect(self.on_plan_generated, Qt.QueuedConnection)
+        self.gui_agent.installation_progress.connect(self.on_installation_progress, Qt.QueuedConnection)
+        self.gui_agent.installation_finished.connect(self.on_installation_finished, Qt.QueuedConnection)
+        self.gui_agent.log_message.connect(self.on_log_message, Qt.QueuedConnection)
+        self.gui_agent.error_occurred.connect(self.on_error_occurred, Qt.QueuedConnection)
+        
+        # Chat requests and replies cross threads, so queue them explicitly
+        self.chat_requested.connect(self.chat_worker.handle_message, Qt.QueuedConnection)
+        self.chat_worker.response_ready.connect(self.on_ai_response, Qt.QueuedConnection)
     
     def setup_styling(self):
         """Apply custom styling to the main window."""
-        # Set stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-            }
-            
-            #sidebar {
-                background-color: #1e1e1e;
-                border-right: 1px solid #404040;
-            }
-            
-            #content-frame {
-                background-color: #2b2b2b;
-            }
-            
-            #logo-label {
-                color: #ffffff;
-                font-size: 24px;
-                font-weight: bold;
-                padding: 20px;
-            }
-            
-            QPushButton {
-                background-color: #404040;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 16px;
-                color: #ffffff;
-                font-size: 14px;
-                text-align: left;
-            }
-            
-            QPushButton:hover {
-                background-color: #505050;
-            }
-            
-            QPushButton:checked {
-                background-color: #0066cc;
-            }
-            
-            QPushButton:pressed {
-                background-color: #0052a3;
-            }
-        """)
+        self.setStyleSheet(MAIN_WINDOW_STYLESHEET)
     
     def navigate_to_screen(self, screen_id: str):
         """Navigate to a specific screen."""
-        if screen_id in self.screens:
-            # Update navigation buttons
-            for btn_id, btn in self.nav_buttons.items():
-                btn.setChecked(btn_id == screen_id)
+        if screen_id in SCREEN_SPECS:
+            self.get_screen(screen_id)
+            
+            # Update navigation buttons; the exclusive group unchecks the rest
+            self.nav_buttons[screen_id].setChecked(True)
             
-            # Switch to screen
-            self.stacked_widget.setCurrentWidget(self.screens[screen_id])
+            # Switch to screen by its cached stack index
+            self.stacked_widget.setCurrentIndex(self.screen_indices[screen_id])
+    
+    @Slot(int)
+    def on_nav_clicked(self, nav_id: int):
+        """Handle a click on a sidebar navigation button."""
+        self.navigate_to_screen(self.nav_screen_ids[nav_id])
     
     def show_welcome_screen(self):
         """Show the welcome screen."""
         self.navigate_to_screen("welcome")
     
+    @Slot()
     def on_start_clicked(self):
         """Handle start button click from welcome screen."""
         self.navigate_to_screen("setup")
     
+    @Slot(str)
     def on_environment_requested(self, environment: str):
         """Handle environment setup request."""
         # Switch to plan screen
         self.navigate_to_screen("plan")
         
         # Request plan from backend
-        self.environment_requested.emit(environment)
+        self.run_with_agent(lambda agent: agent.setup_environment(environment))
     
+    @Slot(list)
     def on_plan_generated(self, plan: list):
         """Handle plan generation from backend."""
         # Update plan renderer
-        self.screens["plan"].update_plan(plan)
+        self.get_screen("plan").update_plan(plan)
         
         # Switch to plan screen
         self.navigate_to_screen("plan")
     
+    @Slot(int, int, str)
     def on_installation_progress(self, step: int, total: int, message: str):
         """Handle installation progress updates."""
         # Update plan renderer progress
-        self.screens["plan"].update_progress(step, total, message)
+        plan_screen = self.plan_screen or self.get_screen("plan")
+        plan_screen.update_progress(step, total, message)
         
         # Add log message
-        self.screens["console"].add_log_message(message)
+        self.queue_log_message(message)
     
+    @Slot(bool, str)
     def on_installation_finished(self, success: bool, message: str):
         """Handle installation completion."""
+        # Show pending log lines before the result
+        self.flush_logs()
+        
         if success:
             # Show success message
-            QMessageBox.information(self, "Installation Complete", message)
+            self.show_message("finish", QMessageBox.Information, "Installation Complete", message)
         else:
             # Show error message
-            QMessageBox.critical(self, "Installation Failed", message)
+            self.show_message("finish", QMessageBox.Critical, "Installation Failed", message)
+    
+    def show_message(self, box_id: str, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a reusable message box without blocking the event loop."""
+        box = self.message_boxes.get(box_id)
+        if box is None:
+            box = QMessageBox(icon, title, "", QMessageBox.Ok, self)
+            box.setModal(False)
+            self.message_boxes[box_id] = box
+        
+        # Repeated messages update the open box instead of stacking new ones
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.show()
+        box.raise_()
     
+    @Slot(str)
     def on_log_message(self, message: str):
         """Handle log message from backend."""
-        self.screens["console"].add_log_message(message)
+        self.queue_log_message(message)
     
+    def queue_log_message(self, message: str):
+        """Buffer a log message for the next console flush."""
+        self.log_buffer.append(message)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+    
+    def flush_logs(self):
+        """Write all buffered log messages to the console as one batch."""
+        self.log_flush_timer.stop()
+        if not self.log_buffer:
+            return
+        
+        console = self.console_screen or self.get_screen("console")
+        console.begin_batch()
+        try:
+            while self.log_buffer:
+                console.add_terminal_output(self.log_buffer.popleft())
+        finally:
+            console.end_batch()
+    
+    @Slot(str)
     def on_error_occurred(self, error_message: str):
         """Handle error from backend."""
-        # Show error modal
-        QMessageBox.critical(self, "Error", error_message)
+        # Record the error and report it in the status bar instead of a dialog
+        self.error_log.append(error_message)
+        if self.error_dialog is not None:
+            self.error_list.addItem(error_message)
+        
+        summary = error_message.splitlines()[0] if error_message else ""
+        if len(summary) > 80:
+            summary = summary[:80] + "…"
+        self.statusBar().showMessage(f"Error: {summary} ({len(self.error_log)} total)", 5000)
+        self.errors_button.setText(f"Errors ({len(self.error_log)})")
         
         # Add to enhanced console
-        if "console" in self.screens:
-            self.screens["console"].add_terminal_output(f"ERROR: {error_message}")
+        self.queue_log_message(f"ERROR: {error_message}")
+    
+    @Slot()
+    def show_error_log(self):
+        """Show the non-modal dialog listing all backend errors."""
+        if self.error_dialog is None:
+            self.error_dialog = QDialog(self)
+            self.error_dialog.setWindowTitle("Errors")
+            self.error_dialog.resize(600, 400)
+            
+            layout = QVBoxLayout(self.error_dialog)
+            self.error_list = QListWidget()
+            self.error_list.setWordWrap(True)
+            self.error_list.addItems(self.error_log)
+            layout.addWidget(self.error_list)
+            
+            buttons = QDialogButtonBox(QDialogButtonBox.Close)
+            buttons.rejected.connect(self.error_dialog.close)
+            layout.addWidget(buttons)
+        
+        self.error_dialog.show()
+        self.error_dialog.raise_()
     
+    @Slot(dict)
     def on_tool_selected(self, tool_info: dict):
         """Handle tool selection from AI suggestions."""
         # Add to installation plan
-        self.gui_agent.add_tool_to_plan(tool_info)
+        self.run_with_agent(lambda agent: agent.add_tool_to_plan(tool_info))
         
         # Show in console
-        if "console" in self.screens:
-            self.screens["console"].add_terminal_output(f"Selected tool: {tool_info['name']}")
+        self.queue_log_message(f"Selected tool: {tool_info['name']}")
     
+    @Slot(dict)
     def on_profile_updated(self, profile: dict):
         """Handle user profile updates."""
         # Update backend with new profile
-        self.gui_agent.update_user_profile(profile)
+        self.run_with_agent(lambda agent: agent.update_user_profile(profile))
         
         # Show in console
-        if "console" in self.screens:
-            self.screens["console"].add_terminal_output("User profile updated")
+        self.queue_log_message("User profile updated")
     
+    @Slot(str)
     def on_ai_message_sent(self, message: str):
         """Handle AI assistant messages."""
-        # Process message with backend
-        response = self.gui_agent.chat_with_agent(message)
-        
+        # Process message with backend on the chat worker thread
+        self.start_chat_thread()
+        self.run_with_agent(lambda agent: self.chat_requested.emit(message))
+    
+    @Slot(str)
+    def on_ai_response(self, response: str):
+        """Handle a response from the chat worker."""
         # Send response back to assistant
-        if "assistant" in self.screens:
-            self.screens["assistant"].receive_ai_response(response)
+        if self.assistant_screen is not None:
+            self.assistant_screen.receive_ai_response(response)
     
+    @Slot(str, bool)
     def on_step_completed(self, step_name: str, success: bool):
         """Handle step completion."""
         # Update backend
-        self.gui_agent.update_step_status(step_name, success)
+        self.run_with_agent(lambda agent: agent.update_step_status(step_name, success))
         
         # Show in console
-        if "console" in self.screens:
-            status = "completed" if success else "failed"
-            self.screens["console"].add_terminal_output(f"Step '{step_name}' {status}")
+        status = "completed" if success else "failed"
+        self.queue_log_message(f"Step '{step_name}' {status}")
     
+    @Slot(str, int)
     def on_command_executed(self, command: str, exit_code: int):
         """Handle command execution."""
         # Update backend
-        self.gui_agent.log_command(command, exit_code)
+        self.run_with_agent(lambda agent: agent.log_command(command, exit_code))
         
         # Show in console
-        if "console" in self.screens:
-            status = "succeeded" if exit_code == 0 else "failed"
-            self.screens["console"].add_terminal_output(f"Command {status} (exit code: {exit_code})")
+        status = "succeeded" if exit_code == 0 else "failed"
+        self.queue_log_message(f"Command {status} (exit code: {exit_code})")
     
     def closeEvent(self, event):
         """Handle application close event."""
-        # Cleanup backend agent
-        if hasattr(self, 'gui_agent'):
-            self.gui_agent.cleanup()
-        
-        event.accept() 
\ No newline at end of file
+        if self.cleanup_done:
+            event.accept()
+            return
+        
+        # Ignore repeated close requests while cleanup is running
+        event.ignore()
+        if self.closing:
+            return
+        self.closing = True
+        
+        # Stop the worker threads; the agent may still be loading or a chat
+        # request running, so continue once they have finished instead of
+        # blocking here
+        for thread in self.worker_threads():
+            thread.finished.connect(self.finish_shutdown, Qt.QueuedConnection)
+            thread.quit()
+        self.finish_shutdown()
+    
+    def worker_threads(self):
+        """Return the agent and chat threads that are still running."""
+        return [
+            thread for thread in (self.agent_thread, self.chat_thread)
+            if thread is not None and thread.isRunning()
+        ]
+    
+    @Slot()
+    def finish_shutdown(self):
+        """Clean up the backend once the worker threads have stopped."""
+        if self.cleanup_done or self.cleanup_thread is not None:
+            return
+        if self.worker_threads():
+            return
+        
+        if self.gui_agent is None:
+            self.on_cleanup_finished()
+            return
+        
+        # Cleanup backend agent on a worker thread and close once it is done
+        self.statusBar().showMessage("Shutting down…")
+        self.cleanup_thread = QThread(self)
+        self.agent_cleanup = AgentCleanup(self.gui_agent)
+        self.agent_cleanup.moveToThread(self.cleanup_thread)
+        self.cleanup_thread.started.connect(self.agent_cleanup.run)
+        self.agent_cleanup.cleanup_finished.connect(self.on_cleanup_finished, Qt.QueuedConnection)
+        self.start_worker_thread(self.cleanup_thread)
+    
+    @Slot()
+    def on_cleanup_finished(self):
+        """Close the window once backend cleanup has completed."""
+        if self.cleanup_thread is not None:
+            self.cleanup_thread.quit()
+            self.cleanup_thread.wait()
+        
+        self.cleanup_done = True
+        self.close()
@@ -8,16 +8,488 @@ Displays session history, memory management, and user preferences.
 Author: CONFIGO Team
 """
 
+import json
+from datetime import datetime
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QFrame, QListWidget, QListWidgetItem,
+    QPushButton, QFrame, QListView,
     QGroupBox, QSizePolicy, QSpacerItem, QTextEdit,
-    QLineEdit, QComboBox, QCheckBox, QMessageBox,
-    QTabWidget, QTableWidget, QTableWidgetItem
+    QLineEdit, QComboBox, QCheckBox, QMessageBox, QApplication, QFileDialog,
+    QTabWidget, QTableView,
+    QStyledItemDelegate, QStyleOptionButton, QStyle
+)
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QEvent, QSize, QAbstractListModel, QAbstractTableModel,
+    QModelIndex
 )
-from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont, QIcon, QPixmap
 
+# Optional fast JSON encoder for memory exports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Timestamp format used for display and exports
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Memory information text; only the counts and timestamp change per update
+MEMORY_INFO_TEMPLATE = """
+        Memory Usage Summary:
+        • Session History Entries: {history}
+        • User Preferences: {preferences}
+        • Tool Statistics: {tools}
+        • Estimated Memory Size: ~2.5 MB
+        • Last Updated: {timestamp}
+        """
+
+
+# Memory view stylesheet, built once at import and set on each MemoryViewWidget
+# so window-level sheets can't override it
+MEMORY_VIEW_STYLESHEET = """
+    MemoryViewWidget, MemoryViewWidget QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    
+    MemoryViewWidget QGroupBox {
+        font-size: 16px;
+        font-weight: bold;
+        color: #ffffff;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    
+    MemoryViewWidget QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    
+    MemoryViewWidget #title-label {
+        font-size: 32px;
+        font-weight: bold;
+        color: #ffffff;
+        margin-bottom: 10px;
+    }
+    
+    MemoryViewWidget #subtitle-label {
+        font-size: 18px;
+        color: #cccccc;
+        margin-bottom: 20px;
+    }
+    
+    MemoryViewWidget #memory-tabs {
+        background-color: #2b2b2b;
+    }
+    
+    MemoryViewWidget QTabWidget::pane {
+        border: 2px solid #404040;
+        border-radius: 8px;
+        background-color: #2b2b2b;
+    }
+    
+    MemoryViewWidget QTabBar::tab {
+        background-color: #404040;
+        color: #ffffff;
+        padding: 10px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+    }
+    
+    MemoryViewWidget QTabBar::tab:selected {
+        background-color: #0066cc;
+    }
+    
+    MemoryViewWidget QTabBar::tab:hover {
+        background-color: #505050;
+    }
+    
+    MemoryViewWidget #history-list, MemoryViewWidget #preferences-table, MemoryViewWidget #stats-table {
+        background-color: #1e1e1e;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        color: #ffffff;
+        font-size: 14px;
+    }
+    
+    MemoryViewWidget #history-list::item {
+        padding: 8px;
+        border-bottom: 1px solid #404040;
+    }
+    
+    MemoryViewWidget #history-list::item:hover {
+        background-color: #404040;
+    }
+    
+    MemoryViewWidget QTableView {
+        gridline-color: #404040;
+    }
+    
+    MemoryViewWidget QTableView::item {
+        padding: 8px;
+    }
+    
+    MemoryViewWidget QTableView::item:selected {
+        background-color: #0066cc;
+    }
+    
+    MemoryViewWidget QHeaderView::section {
+        background-color: #404040;
+        color: #ffffff;
+        padding: 8px;
+        border: none;
+    }
+    
+    MemoryViewWidget #clear-history-button, MemoryViewWidget #export-history-button, MemoryViewWidget #add-pref-button,
+    MemoryViewWidget #clear-memory-button, MemoryViewWidget #export-memory-button {
+        background-color: #404040;
+        border: none;
+        border-radius: 6px;
+        color: #ffffff;
+        font-size: 14px;
+        padding: 8px 16px;
+    }
+    
+    MemoryViewWidget #clear-history-button:hover, MemoryViewWidget #export-history-button:hover, MemoryViewWidget #add-pref-button:hover,
+    MemoryViewWidget #clear-memory-button:hover, MemoryViewWidget #export-memory-button:hover {
+        background-color: #505050;
+    }
+    
+    MemoryViewWidget #clear-history-button:pressed, MemoryViewWidget #export-history-button:pressed, MemoryViewWidget #add-pref-button:pressed,
+    MemoryViewWidget #clear-memory-button:pressed, MemoryViewWidget #export-memory-button:pressed {
+        background-color: #0066cc;
+    }
+    
+    MemoryViewWidget QLineEdit {
+        background-color: #1e1e1e;
+        border: 2px solid #404040;
+        border-radius: 6px;
+        color: #ffffff;
+        font-size: 14px;
+        padding: 8px 12px;
+    }
+    
+    MemoryViewWidget QLineEdit:focus {
+        border-color: #0066cc;
+    }
+    
+    MemoryViewWidget QComboBox {
+        background-color: #1e1e1e;
+        border: 2px solid #404040;
+        border-radius: 6px;
+        color: #ffffff;
+        font-size: 14px;
+        padding: 8px 12px;
+    }
+    
+    MemoryViewWidget QComboBox:focus {
+        border-color: #0066cc;
+    }
+    
+    MemoryViewWidget QCheckBox {
+        font-size: 14px;
+        color: #cccccc;
+    }
+    
+    MemoryViewWidget #memory-info-label, MemoryViewWidget #stats-summary {
+        font-size: 14px;
+        color: #cccccc;
+        line-height: 1.5;
+    }
+"""
+
+
+def encode_session_history(history: list) -> dict:
+    """
+    Dictionary-encode session history for export.
+    
+    Each distinct entry is stored once in msgIndex and the history is kept as
+    a sequence of indices into it, so repeated entries cost one integer each.
+    """
+    msg_index = list(dict.fromkeys(history))
+    lookup = {entry: i for i, entry in enumerate(msg_index)}
+    return {
+        "msgIndex": msg_index,
+        "msgSequence": [lookup[entry] for entry in history],
+    }
+
+
+def decode_session_history(data) -> list:
+    """Decode exported session history, accepting encoded or plain lists."""
+    if isinstance(data, dict):
+        msg_index = data["msgIndex"]
+        return [msg_index[i] for i in data["msgSequence"]]
+    return list(data)
+
+
+class ToolStat:
+    """Usage statistics for a single tool."""
+    
+    __slots__ = ('installations', 'success_rate', 'last_used')
+    
+    def __init__(self, installations: int, success_rate: float, last_used: str):
+        self.installations = installations
+        self.success_rate = success_rate  # Percent, e.g. 93.0
+        self.last_used = last_used
+    
+    def to_dict(self) -> dict:
+        """Return the statistics as a JSON-serializable dict."""
+        return {
+            "installations": self.installations,
+            "success_rate": self.success_rate,
+            "last_used": self.last_used,
+        }
+
+
+class HistoryModel(QAbstractListModel):
+    """
+    List model over the session history entries.
+    
+    Rows are revealed to the view in batches through canFetchMore/fetchMore,
+    so long histories are only laid out as the user scrolls to them.
+    """
+    
+    FETCH_BATCH_SIZE = 200
+    
+    def __init__(self, entries: list, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.loaded = 0
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows revealed so far."""
+        if parent.isValid():
+            return 0
+        return min(self.loaded, len(self.entries))
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the history entry text for a row."""
+        if role == Qt.DisplayRole and index.isValid():
+            return self.entries[index.row()]
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        """Return whether there are entries not yet revealed to the view."""
+        if parent.isValid():
+            return False
+        return self.loaded < len(self.entries)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Reveal the next batch of entries."""
+        if parent.isValid():
+            return
+        
+        count = min(self.FETCH_BATCH_SIZE, len(self.entries) - self.loaded)
+        if count <= 0:
+            return
+        
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+    
+    def append_entries(self, entries: list):
+        """Append entries, revealing the first batch if all rows were shown."""
+        fully_loaded = self.loaded >= len(self.entries)
+        self.entries.extend(entries)
+        if fully_loaded:
+            self.fetchMore()
+    
+    def clear(self):
+        """Remove all entries."""
+        self.beginResetModel()
+        self.entries.clear()
+        self.loaded = 0
+        self.endResetModel()
+
+
+class DictTableModel(QAbstractTableModel):
+    """
+    Table model with one row per key of a dict, in insertion order.
+    
+    The dict is shared with the owner, which mutates it and then calls
+    update_key/remove_key so only the affected row is inserted, changed
+    or removed. Subclasses define HEADERS and override cell_text() to format
+    their columns.
+    """
+    
+    HEADERS = ()
+    
+    def __init__(self, items: dict, parent=None):
+        super().__init__(parent)
+        self.items = items
+        self.keys = list(items)
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of keys."""
+        if parent.isValid():
+            return 0
+        return len(self.keys)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return the column titles; rows keep the default numbering."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the cell text for a row."""
+        if role in (Qt.DisplayRole, Qt.EditRole) and index.isValid():
+            key = self.keys[index.row()]
+            return self.cell_text(key, self.items[key], index.column())
+        return None
+    
+    def flags(self, index):
+        """Cells are read-only unless a subclass says otherwise."""
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def cell_text(self, key, value, column: int):
+        """Return the key in the first column and the value in the second."""
+        if column == 0:
+            return str(key)
+        if column == 1:
+            return str(value)
+        return None
+    
+    def key_at(self, row: int):
+        """Return the key shown in a row."""
+        return self.keys[row]
+    
+    def reset(self, items: dict):
+        """Replace the dict and rebuild every row."""
+        self.beginResetModel()
+        self.items = items
+        self.keys = list(items)
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+        self.endResetModel()
+    
+    def update_key(self, key):
+        """Refresh the row for key, appending it if it is new."""
+        row = self.rows.get(key)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+            return
+        
+        row = len(self.keys)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.keys.append(key)
+        self.rows[key] = row
+        self.endInsertRows()
+    
+    def remove_key(self, key):
+        """Remove the row for key and shift the rows below it."""
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.keys[row]
+        for shifted_row in range(row, len(self.keys)):
+            self.rows[self.keys[shifted_row]] = shifted_row
+        self.endRemoveRows()
+
+
+class PreferencesModel(DictTableModel):
+    """Table model over the user preferences; values are editable."""
+    
+    HEADERS = ("Preference", "Value", "Actions")
+    
+    # Signals
+    value_edited = Signal(str, str)  # Emitted when a value is edited in the view
+    
+    def cell_text(self, key, value, column: int):
+        """Return the preference name, value, or nothing for the actions column."""
+        if column == 0:
+            return key
+        if column == 1:
+            return value
+        return None
+    
+    def flags(self, index):
+        """Allow editing preference values."""
+        if index.column() == 1:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+        if index.column() == 2:
+            return Qt.ItemIsEnabled
+        return super().flags(index)
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        """Hand an edited preference value to the owner to store."""
+        if role != Qt.EditRole or index.column() != 1:
+            return False
+        
+        key = self.keys[index.row()]
+        if self.items[key] != value:
+            self.value_edited.emit(key, value)
+        return True
+
+
+class StatsModel(DictTableModel):
+    """Table model over the tool statistics."""
+    
+    HEADERS = ("Tool", "Installations", "Success Rate", "Last Used")
+    
+    def cell_text(self, key, value, column: int):
+        """Return the text of one statistics cell."""
+        if column == 0:
+            return key
+        if column == 1:
+            return str(value.installations)
+        if column == 2:
+            return f"{value.success_rate:g}%"
+        return value.last_used
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """
+    Item delegate that paints a delete button in each cell of a column.
+    
+    The button is drawn rather than created as a cell widget, so the table
+    holds no child widgets per row; clicks are reported via delete_requested.
+    """
+    
+    # Signals
+    delete_requested = Signal(int)  # Emitted with the row whose button was clicked
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.icon = None
+    
+    def paint(self, painter, option, index):
+        """Paint a push button with a trash icon inside the cell."""
+        style = option.widget.style() if option.widget else QApplication.style()
+        if self.icon is None:
+            self.icon = style.standardIcon(QStyle.SP_TrashIcon)
+        
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(4, 4, -4, -4)
+        button.icon = self.icon
+        button.iconSize = QSize(16, 16)
+        button.state = QStyle.State_Enabled
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+    
+    def editorEvent(self, event, model, option, index):
+        """Emit delete_requested when the button is clicked."""
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.delete_requested.emit(index.row())
+            return True
+        return False
+
 
 class MemoryViewWidget(QWidget):
     """
@@ -33,17 +505,61 @@ class MemoryViewWidget(QWidget):
     # Signals
     memory_cleared = Signal()  # Emitted when memory is cleared
     preference_updated = Signal(str, str)  # Emitted when a preference is updated
+    preferences_batched = Signal(dict)  # Emitted with coalesced preference changes (None = deleted)
+    
+    # Button icons, loaded on first use and shared by all instances
+    button_icons = None
     
     def __init__(self):
         super().__init__()
         self.session_history = []
         self.user_preferences = {}
         self.tool_statistics = {}
+        
+        # Contents last rendered by a full table rebuild; None once a table
+        # has been changed incrementally
+        self.last_prefs_snapshot = None
+        self.last_stats_snapshot = None
+        
+        # Preference changes waiting to be emitted as one preferences_batched
+        self.pending_pref_changes = {}
+        
+        # Counts shown in the memory information at its last update
+        self.last_memory_counts = None
+        
+        # Running totals for the statistics summary; success rates are
+        # stored as numbers (percent) and only formatted for display
+        self.stats_total_installations = 0
+        self.stats_success_rate_sum = 0.0
+        
+        # Throttle summary refreshes so bulk mutations repaint once per interval
+        self.memory_info_timer = QTimer(self)
+        self.memory_info_timer.setSingleShot(True)
+        self.memory_info_timer.setInterval(100)
+        self.memory_info_timer.timeout.connect(self.update_memory_info)
+        
+        self.stats_summary_timer = QTimer(self)
+        self.stats_summary_timer.setSingleShot(True)
+        self.stats_summary_timer.setInterval(100)
+        self.stats_summary_timer.timeout.connect(self.update_statistics_summary)
+        
         self.setup_ui()
         self.setup_connections()
         self.setup_styling()
         self.load_sample_data()
     
+    @classmethod
+    def load_button_icons(cls) -> dict:
+        """Return the shared button icons, loading them on first call."""
+        if cls.button_icons is None:
+            style = QApplication.style()
+            cls.button_icons = {
+                "clear": style.standardIcon(QStyle.SP_TrashIcon),
+                "export": style.standardIcon(QStyle.SP_DialogSaveButton),
+                "add": QIcon.fromTheme("list-add", style.standardIcon(QStyle.SP_FileDialogNewFolder)),
+            }
+        return cls.button_icons
+    
     def setup_ui(self):
         """Initialize the memory view UI components."""
         # Main layout
@@ -105,20 +621,22 @@ class MemoryViewWidget(QWidget):
         history_widget = QWidget()
         history_layout = QVBoxLayout(history_widget)
         
-        # History list
-        self.history_list = QListWidget()
-        self.history_list.setObjectName("history-list")
-        history_layout.addWidget(self.history_list)
+        # History list, backed by a model over session_history
+        self.history_model = HistoryModel(self.session_history, self)
+        self.history_view = QListView()
+        self.history_view.setObjectName("history-list")
+        self.history_view.setModel(self.history_model)
+        history_layout.addWidget(self.history_view)
         
         # Controls
         controls_layout = QHBoxLayout()
         
-        self.clear_history_button = QPushButton("🗑️ Clear History")
+        self.clear_history_button = QPushButton(self.load_button_icons()["clear"], "Clear History")
         self.clear_history_button.setObjectName("clear-history-button")
         self.clear_history_button.clicked.connect(self.on_clear_history)
         controls_layout.addWidget(self.clear_history_button)
         
-        self.export_history_button = QPushButton("📁 Export History")
+        self.export_history_button = QPushButton(self.load_button_icons()["export"], "Export History")
         self.export_history_button.setObjectName("export-history-button")
         self.export_history_button.clicked.connect(self.on_export_history)
         controls_layout.addWidget(self.export_history_button)
@@ -133,11 +651,17 @@ class MemoryViewWidget(QWidget):
         preferences_widget = QWidget()
         preferences_layout = QVBoxLayout(preferences_widget)
         
-        # Preferences table
-        self.preferences_table = QTableWidget()
+        # Preferences table, backed by a model over user_preferences
+        self.preferences_model = PreferencesModel(self.user_preferences, self)
+        self.preferences_model.value_edited.connect(self.on_preference_edited)
+        self.preferences_table = QTableView()
         self.preferences_table.setObjectName("preferences-table")
-        self.preferences_table.setColumnCount(3)
-        self.preferences_table.setHorizontalHeaderLabels(["Preference", "Value", "Actions"])
+        self.preferences_table.setModel(self.preferences_model)
+        
+        # Delete buttons are painted by a shared delegate instead of per-row widgets
+        self.delete_delegate = DeleteButtonDelegate(self.preferences_table)
+        self.delete_delegate.delete_requested.connect(self.on_delete_preference_row)
+        self.preferences_table.setItemDelegateForColumn(2, self.delete_delegate)
         preferences_layout.addWidget(self.preferences_table)
         
         # Add preference controls
@@ -151,7 +675,7 @@ class MemoryViewWidget(QWidget):
         self.pref_value_input.setPlaceholderText("Preference value")
         add_layout.addWidget(self.pref_value_input)
         
-        self.add_pref_button = QPushButton("➕ Add")
+        self.add_pref_button = QPushButton(self.load_button_icons()["add"], "Add")
         self.add_pref_button.setObjectName("add-pref-button")
         self.add_pref_button.clicked.connect(self.on_add_preference)
         add_layout.addWidget(self.add_pref_button)
@@ -165,11 +689,11 @@ class MemoryViewWidget(QWidget):
         stats_widget = QWidget()
         stats_layout = QVBoxLayout(stats_widget)
         
-        # Statistics table
-        self.stats_table = QTableWidget()
+        # Statistics table, backed by a model over tool_statistics
+        self.stats_model = StatsModel(self.tool_statistics, self)
+        self.stats_table = QTableView()
         self.stats_table.setObjectName("stats-table")
-        self.stats_table.setColumnCount(4)
-        self.stats_table.setHorizontalHeaderLabels(["Tool", "Installations", "Success Rate", "Last Used"])
+        self.stats_table.setModel(self.stats_model)
         stats_layout.addWidget(self.stats_table)
         
         # Summary
@@ -203,13 +727,13 @@ class MemoryViewWidget(QWidget):
         memory_controls_layout = QVBoxLayout(memory_controls_group)
         
         # Clear memory button
-        self.clear_memory_button = QPushButton("🗑️ Clear All Memory")
+        self.clear_memory_button = QPushButton(self.load_button_icons()["clear"], "Clear All Memory")
         self.clear_memory_button.setObjectName("clear-memory-button")
         self.clear_memory_button.clicked.connect(self.on_clear_memory)
         memory_controls_layout.addWidget(self.clear_memory_button)
         
         # Export memory button
-        self.export_memory_button = QPushButton("📁 Export Memory")
+        self.export_memory_button = QPushButton(self.load_button_icons()["export"], "Export Memory")
         self.export_memory_button.setObjectName("export-memory-button")
         self.export_memory_button.clicked.connect(self.on_export_memory)
         memory_controls_layout.addWidget(self.export_memory_button)
@@ -237,12 +761,7 @@ class MemoryViewWidget(QWidget):
     
     def setup_connections(self):
         """Setup signal connections."""
-        # Connect buttons
-        self.clear_history_button.clicked.connect(self.on_clear_history)
-        self.export_history_button.clicked.connect(self.on_export_history)
-        self.add_pref_button.clicked.connect(self.on_add_preference)
-        self.clear_memory_button.clicked.connect(self.on_clear_memory)
-        self.export_memory_button.clicked.connect(self.on_export_memory)
+        # Buttons are connected where they are created in the setup_*_tab methods
         
         # Connect settings
         self.auto_save_check.toggled.connect(self.on_auto_save_toggled)
@@ -250,161 +769,7 @@ class MemoryViewWidget(QWidget):
     
     def setup_styling(self):
         """Apply custom styling to the memory view widget."""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            
-            #title-label {
-                font-size: 32px;
-                font-weight: bold;
-                color: #ffffff;
-                margin-bottom: 10px;
-            }
-            
-            #subtitle-label {
-                font-size: 18px;
-                color: #cccccc;
-                margin-bottom: 20px;
-            }
-            
-            #memory-tabs {
-                background-color: #2b2b2b;
-            }
-            
-            QTabWidget::pane {
-                border: 2px solid #404040;
-                border-radius: 8px;
-                background-color: #2b2b2b;
-            }
-            
-            QTabBar::tab {
-                background-color: #404040;
-                color: #ffffff;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #0066cc;
-            }
-            
-            QTabBar::tab:hover {
-                background-color: #505050;
-            }
-            
-            #history-list, #preferences-table, #stats-table {
-                background-color: #1e1e1e;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-            }
-            
-            #history-list::item {
-                padding: 8px;
-                border-bottom: 1px solid #404040;
-            }
-            
-            #history-list::item:hover {
-                background-color: #404040;
-            }
-            
-            QTableWidget {
-                gridline-color: #404040;
-            }
-            
-            QTableWidget::item {
-                padding: 8px;
-            }
-            
-            QTableWidget::item:selected {
-                background-color: #0066cc;
-            }
-            
-            QHeaderView::section {
-                background-color: #404040;
-                color: #ffffff;
-                padding: 8px;
-                border: none;
-            }
-            
-            #clear-history-button, #export-history-button, #add-pref-button,
-            #clear-memory-button, #export-memory-button {
-                background-color: #404040;
-                border: none;
-                border-radius: 6px;
-                color: #ffffff;
-                font-size: 14px;
-                padding: 8px 16px;
-            }
-            
-            #clear-history-button:hover, #export-history-button:hover, #add-pref-button:hover,
-            #clear-memory-button:hover, #export-memory-button:hover {
-                background-color: #505050;
-            }
-            
-            #clear-history-button:pressed, #export-history-button:pressed, #add-pref-button:pressed,
-            #clear-memory-button:pressed, #export-memory-button:pressed {
-                background-color: #0066cc;
-            }
-            
-            QLineEdit {
-                background-color: #1e1e1e;
-                border: 2px solid #404040;
-                border-radius: 6px;
-                color: #ffffff;
-                font-size: 14px;
-                padding: 8px 12px;
-            }
-            
-            QLineEdit:focus {
-                border-color: #0066cc;
-            }
-            
-            QComboBox {
-                background-color: #1e1e1e;
-                border: 2px solid #404040;
-                border-radius: 6px;
-                color: #ffffff;
-                font-size: 14px;
-                padding: 8px 12px;
-            }
-            
-            QComboBox:focus {
-                border-color: #0066cc;
-            }
-            
-            QCheckBox {
-                font-size: 14px;
-                color: #cccccc;
-            }
-            
-            #memory-info-label, #stats-summary {
-                font-size: 14px;
-                color: #cccccc;
-                line-height: 1.5;
-            }
-        """)
+        self.setStyleSheet(MEMORY_VIEW_STYLESHEET)
     
     def load_sample_data(self):
         """Load sample data for demonstration."""
@@ -418,9 +783,7 @@ class MemoryViewWidget(QWidget):
             "2024-01-13 11:30 - Installed TensorFlow and Jupyter"
         ]
         
-        for entry in sample_history:
-            item = QListWidgetItem(entry)
-            self.history_list.addItem(item)
+        self.history_model.append_entries(sample_history)
         
         # Sample user preferences
         sample_preferences = {
@@ -431,105 +794,117 @@ class MemoryViewWidget(QWidget):
             "Log Level": "INFO"
         }
         
-        self.user_preferences = sample_preferences
-        self.update_preferences_table()
+        self.add_preferences(sample_preferences)
         
         # Sample tool statistics
         sample_stats = {
-            "Python": {"installations": 15, "success_rate": "93%", "last_used": "2024-01-15"},
-            "Node.js": {"installations": 8, "success_rate": "88%", "last_used": "2024-01-14"},
-            "Docker": {"installations": 12, "success_rate": "92%", "last_used": "2024-01-13"},
-            "Git": {"installations": 20, "success_rate": "95%", "last_used": "2024-01-15"}
+            "Python": ToolStat(15, 93.0, "2024-01-15"),
+            "Node.js": ToolStat(8, 88.0, "2024-01-14"),
+            "Docker": ToolStat(12, 92.0, "2024-01-13"),
+            "Git": ToolStat(20, 95.0, "2024-01-15")
         }
         
-        self.tool_statistics = sample_stats
-        self.update_statistics_table()
+        for tool, stats in sample_stats.items():
+            self.update_tool_statistics(tool, stats)
         
         # Update memory info
         self.update_memory_info()
     
     def update_preferences_table(self):
-        """Update the preferences table."""
-        self.preferences_table.setRowCount(len(self.user_preferences))
-        
-        for row, (key, value) in enumerate(self.user_preferences.items()):
-            # Preference name
-            name_item = QTableWidgetItem(key)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.preferences_table.setItem(row, 0, name_item)
-            
-            # Preference value
-            value_item = QTableWidgetItem(value)
-            self.preferences_table.setItem(row, 1, value_item)
-            
-            # Actions button
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-            
-            delete_button = QPushButton("🗑️")
-            delete_button.setObjectName("delete-pref-button")
-            delete_button.clicked.connect(lambda checked, k=key: self.on_delete_preference(k))
-            actions_layout.addWidget(delete_button)
-            
-            self.preferences_table.setCellWidget(row, 2, actions_widget)
+        """Rebuild the preferences table from user_preferences."""
+        snapshot = tuple(self.user_preferences.items())
+        if snapshot == self.last_prefs_snapshot:
+            return
+        self.last_prefs_snapshot = snapshot
+        
+        self.preferences_model.reset(self.user_preferences)
     
     def update_statistics_table(self):
-        """Update the statistics table."""
-        self.stats_table.setRowCount(len(self.tool_statistics))
-        
-        for row, (tool, stats) in enumerate(self.tool_statistics.items()):
-            # Tool name
-            name_item = QTableWidgetItem(tool)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.stats_table.setItem(row, 0, name_item)
-            
-            # Installations
-            installs_item = QTableWidgetItem(str(stats["installations"]))
-            installs_item.setFlags(installs_item.flags() & ~Qt.ItemIsEditable)
-            self.stats_table.setItem(row, 1, installs_item)
-            
-            # Success rate
-            success_item = QTableWidgetItem(stats["success_rate"])
-            success_item.setFlags(success_item.flags() & ~Qt.ItemIsEditable)
-            self.stats_table.setItem(row, 2, success_item)
-            
-            # Last used
-            last_used_item = QTableWidgetItem(stats["last_used"])
-            last_used_item.setFlags(last_used_item.flags() & ~Qt.ItemIsEditable)
-            self.stats_table.setItem(row, 3, last_used_item)
+        """Rebuild the statistics table from tool_statistics."""
+        snapshot = tuple(
+            (tool, stats.installations, stats.success_rate, stats.last_used)
+            for tool, stats in self.tool_statistics.items()
+        )
+        if snapshot == self.last_stats_snapshot:
+            return
+        self.last_stats_snapshot = snapshot
         
-        # Update summary
-        total_installations = sum(stats["installations"] for stats in self.tool_statistics.values())
-        avg_success_rate = sum(float(stats["success_rate"].rstrip('%')) for stats in self.tool_statistics.values()) / len(self.tool_statistics)
+        self.stats_total_installations = 0
+        self.stats_success_rate_sum = 0.0
+        for stats in self.tool_statistics.values():
+            self.stats_total_installations += stats.installations
+            self.stats_success_rate_sum += stats.success_rate
         
-        self.stats_summary.setText(
-            f"Total installations: {total_installations} | "
+        self.stats_model.reset(self.tool_statistics)
+        self.update_statistics_summary()
+    
+    def update_tool_statistics(self, tool: str, stats: ToolStat):
+        """Add or update the statistics for a single tool."""
+        previous = self.tool_statistics.get(tool)
+        if previous is not None:
+            self.stats_total_installations -= previous.installations
+            self.stats_success_rate_sum -= previous.success_rate
+        self.stats_total_installations += stats.installations
+        self.stats_success_rate_sum += stats.success_rate
+        
+        self.tool_statistics[tool] = stats
+        self.last_stats_snapshot = None
+        self.stats_model.update_key(tool)
+        self.schedule_statistics_summary_update()
+        self.schedule_memory_info_update()
+    
+    def schedule_statistics_summary_update(self):
+        """Refresh the statistics summary on the next throttle tick."""
+        if not self.stats_summary_timer.isActive():
+            self.stats_summary_timer.start()
+    
+    def update_statistics_summary(self):
+        """Update the statistics summary label."""
+        if not self.tool_statistics:
+            self.stats_summary.setText("No tool statistics recorded")
+            return
+        
+        avg_success_rate = self.stats_success_rate_sum / len(self.tool_statistics)
+        
+        summary = (
+            f"Total installations: {self.stats_total_installations} | "
             f"Average success rate: {avg_success_rate:.1f}% | "
             f"Tools tracked: {len(self.tool_statistics)}"
         )
+        
+        # Avoid a relayout when the text is unchanged
+        if self.stats_summary.text() != summary:
+            self.stats_summary.setText(summary)
+    
+    def schedule_memory_info_update(self):
+        """Refresh the memory information on the next throttle tick."""
+        if not self.memory_info_timer.isActive():
+            self.memory_info_timer.start()
     
     def update_memory_info(self):
         """Update the memory information display."""
-        total_history = self.history_list.count()
+        total_history = len(self.session_history)
         total_preferences = len(self.user_preferences)
         total_tools = len(self.tool_statistics)
         
-        memory_info = f"""
-        Memory Usage Summary:
-        • Session History Entries: {total_history}
-        • User Preferences: {total_preferences}
-        • Tool Statistics: {total_tools}
-        • Estimated Memory Size: ~2.5 MB
-        • Last Updated: {self.get_current_timestamp()}
-        """
+        # Skip the re-render when a mutation left every count unchanged
+        counts = (total_history, total_preferences, total_tools)
+        if counts == self.last_memory_counts:
+            return
+        self.last_memory_counts = counts
+        
+        memory_info = MEMORY_INFO_TEMPLATE.format(
+            history=total_history,
+            preferences=total_preferences,
+            tools=total_tools,
+            timestamp=self.get_current_timestamp(),
+        )
         
         self.memory_info_label.setText(memory_info)
     
     def get_current_timestamp(self):
         """Get current timestamp string."""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return datetime.now().strftime(TIMESTAMP_FORMAT)
     
     def on_clear_history(self):
         """Handle clear history button click."""
@@ -542,14 +917,11 @@ class MemoryViewWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            self.history_list.clear()
-            self.session_history.clear()
-            self.update_memory_info()
+            self.history_model.clear()
+            self.schedule_memory_info_update()
     
     def on_export_history(self):
         """Handle export history button click."""
-        from PySide6.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export History",
@@ -559,10 +931,10 @@ class MemoryViewWidget(QWidget):
         
         if file_path:
             try:
+                # Join the history up front and write it in a single call
+                text = ''.join(entry + '\n' for entry in self.session_history)
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    for i in range(self.history_list.count()):
-                        item = self.history_list.item(i)
-                        f.write(item.text() + '\n')
+                    f.write(text)
                 
                 QMessageBox.information(
                     self,
@@ -583,8 +955,10 @@ class MemoryViewWidget(QWidget):
         
         if name and value:
             self.user_preferences[name] = value
-            self.update_preferences_table()
-            self.update_memory_info()
+            self.last_prefs_snapshot = None
+            self.preferences_model.update_key(name)
+            self.schedule_memory_info_update()
+            self.queue_preference_change(name, value)
             
             # Clear inputs
             self.pref_name_input.clear()
@@ -595,12 +969,47 @@ class MemoryViewWidget(QWidget):
         else:
             QMessageBox.warning(self, "Invalid Input", "Please provide both name and value.")
     
+    def on_preference_edited(self, name: str, value: str):
+        """Store a preference value edited in the preferences table."""
+        self.user_preferences[name] = value
+        self.last_prefs_snapshot = None
+        self.preferences_model.update_key(name)
+        self.queue_preference_change(name, value)
+        self.preference_updated.emit(name, value)
+    
     def on_delete_preference(self, key: str):
         """Handle delete preference button click."""
         if key in self.user_preferences:
             del self.user_preferences[key]
-            self.update_preferences_table()
-            self.update_memory_info()
+            self.last_prefs_snapshot = None
+            self.preferences_model.remove_key(key)
+            self.schedule_memory_info_update()
+            self.queue_preference_change(key, None)
+    
+    def add_preferences(self, preferences: dict):
+        """Add or update several preferences at once."""
+        self.user_preferences.update(preferences)
+        self.update_preferences_table()
+        self.schedule_memory_info_update()
+        
+        for name, value in preferences.items():
+            self.queue_preference_change(name, value)
+    
+    def queue_preference_change(self, name: str, value):
+        """Record a preference change for the next preferences_batched emission."""
+        if not self.pending_pref_changes:
+            QTimer.singleShot(0, self.flush_preference_changes)
+        self.pending_pref_changes[name] = value
+    
+    def flush_preference_changes(self):
+        """Emit all pending preference changes as a single batch."""
+        changes, self.pending_pref_changes = self.pending_pref_changes, {}
+        if changes:
+            self.preferences_batched.emit(changes)
+    
+    def on_delete_preference_row(self, row: int):
+        """Handle a click on the delete button of a preferences table row."""
+        self.on_delete_preference(self.preferences_model.key_at(row))
     
     def on_clear_memory(self):
         """Handle clear memory button click."""
@@ -613,21 +1022,18 @@ class MemoryViewWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            self.history_list.clear()
-            self.session_history.clear()
+            self.history_model.clear()
             self.user_preferences.clear()
             self.tool_statistics.clear()
             
             self.update_preferences_table()
             self.update_statistics_table()
-            self.update_memory_info()
+            self.schedule_memory_info_update()
             
             self.memory_cleared.emit()
     
     def on_export_memory(self):
         """Handle export memory button click."""
-        from PySide6.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Memory",
@@ -637,17 +1043,21 @@ class MemoryViewWidget(QWidget):
         
         if file_path:
             try:
-                import json
-                
                 memory_data = {
-                    "session_history": [self.history_list.item(i).text() for i in range(self.history_list.count())],
+                    "session_history": encode_session_history(self.session_history),
                     "user_preferences": self.user_preferences,
-                    "tool_statistics": self.tool_statistics,
+                    "tool_statistics": {tool: stats.to_dict() for tool, stats in self.tool_statistics.items()},
                     "export_timestamp": self.get_current_timestamp()
                 }
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(memory_data, f, indent=2)
+                # Encode in one pass and write the bytes in a single call
+                if ORJSON_AVAILABLE:
+                    data = orjson.dumps(memory_data, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(memory_data, indent=2).encode('utf-8')
+                
+                with open(file_path, 'wb') as f:
+                    f.write(data)
                 
                 QMessageBox.information(
                     self,
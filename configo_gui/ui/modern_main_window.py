@@ -9,6 +9,7 @@ Author: CONFIGO Team
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -18,15 +19,15 @@ from PySide6.QtWidgets import (
     QSizePolicy, QSpacerItem, QScrollArea, QTextEdit,
     QLineEdit, QProgressBar, QGroupBox, QGridLayout,
     QListWidget, QListWidgetItem, QTabWidget, QSplitter,
-    QMessageBox, QDialog, QDialogButtonBox, QStatusBar,
-    QGraphicsDropShadowEffect, QGraphicsBlurEffect
+    QMessageBox, QDialog, QDialogButtonBox, QStatusBar, QButtonGroup,
+    QApplication
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve, QThread, QPoint
-from PySide6.QtGui import QFont, QIcon, QPixmap, QPalette, QColor, QPainter, QLinearGradient
+from PySide6.QtCore import Qt, Signal, QObject, QTimer, QPropertyAnimation, QEasingCurve, QThread
+from PySide6.QtGui import QFont, QIcon, QPixmap, QPalette
 
 # Import modern UI components
 from .themes.glass_theme import GlassTheme
-from .themes.animations import AnimationManager
+from .themes.animations import AnimationManager, CHROME_ANIMATION_FPS
 from .themes.modern_styles import ModernStyles
 from .components.glass_card import GlassCard
 from .components.animated_button import AnimatedButton
@@ -49,14 +50,12 @@ try:
     from configo_gui.configo_core.gui_agent import ConfigoGUIAgent
 except ImportError:
     # Create a mock agent for demo purposes
-    class ConfigoGUIAgent:
-        def __init__(self):
-            self.environment_requested = Signal(str)
-            self.plan_generated = Signal(list)
-            self.installation_started = Signal()
-            self.installation_finished = Signal(bool, str)
-            self.log_updated = Signal(str)
-            self.error_occurred = Signal(str)
+    class ConfigoGUIAgent(QObject):
+        plan_generated = Signal(list)
+        installation_progress = Signal(int, int, str)
+        installation_finished = Signal(bool, str)
+        log_message = Signal(str)
+        error_occurred = Signal(str)
         
         def setup_environment(self, environment):
             pass
@@ -65,6 +64,86 @@ except ImportError:
             pass
 
 
+def stop_thread(thread: QThread):
+    """Quit a worker thread and wait for it to finish."""
+    thread.quit()
+    thread.wait()
+
+
+class AgentCleanup(QObject):
+    """
+    Worker object that runs the GUI agent cleanup on the agent thread.
+    
+    Cleanup is queued behind any backend call still running there, and the
+    thread is stopped once it has completed.
+    """
+    
+    def __init__(self, gui_agent: ConfigoGUIAgent):
+        super().__init__()
+        self.gui_agent = gui_agent
+    
+    def run(self):
+        """Clean up the GUI agent, then stop its thread."""
+        try:
+            self.gui_agent.cleanup()
+        finally:
+            QThread.currentThread().quit()
+
+
+# Minimum interval between status bar repaints (one frame at 60 Hz)
+STATUS_UPDATE_INTERVAL_MS = 16
+
+# Sidebar navigation entries: (screen id, button label)
+NAV_ITEMS = tuple(
+    (screen_id, f"{icon} {text}")
+    for icon, text, screen_id in (
+        ("🏠", "Welcome", "welcome"),
+        ("⚙️", "Environment", "environment"),
+        ("📋", "Plan", "plan"),
+        ("🖥️", "Console", "console"),
+        ("🌐", "Portals", "portals"),
+        ("💾", "Memory", "memory"),
+        ("🤖", "AI Assistant", "ai_assistant"),
+        ("🔮", "Predictions", "predictions"),
+        ("⚡", "Terminal", "terminal"),
+    )
+)
+NAV_SCREEN_IDS = {nav_id: screen_id for nav_id, (screen_id, _) in enumerate(NAV_ITEMS)}
+
+# Screen registry: screen id -> (factory, [(screen signal, window slot), ...]);
+# screens are instantiated on first navigation
+SCREEN_SPECS = {
+    "welcome": (WelcomeScreen, []),
+    "environment": (EnvironmentSetupScreen, [("environment_requested", "on_environment_requested")]),
+    "plan": (PlanRendererScreen, []),
+    "console": (LogConsoleWidget, []),
+    "portals": (PortalIntegrationWidget, []),
+    "memory": (MemoryViewWidget, []),
+    "ai_assistant": (AIAssistantPanel, []),
+    "predictions": (PredictiveSuggestionsPanel, []),
+    "terminal": (EnhancedTerminalConsole, []),
+}
+
+
+class RedrawGuard:
+    """
+    Context manager that suspends repaints of a widget for a block of updates.
+    
+    The widget is repainted once when the block exits.
+    """
+    
+    def __init__(self, widget: QWidget):
+        self.widget = widget
+    
+    def __enter__(self):
+        self.widget.setUpdatesEnabled(False)
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.widget.setUpdatesEnabled(True)
+        self.widget.update()
+
+
 class ModernMainWindow(QMainWindow):
     """
     Modern main window for CONFIGO GUI application with glassmorphism design.
@@ -85,37 +164,87 @@ class ModernMainWindow(QMainWindow):
     installation_finished = Signal(bool, str)
     log_updated = Signal(str)
     error_occurred = Signal(str)
+    setup_requested = Signal(str)  # Emitted to run an environment setup on the agent thread
+    cleanup_requested = Signal()  # Emitted to run the agent cleanup on the agent thread
     
     def __init__(self):
         super().__init__()
         
+        # Application instance, resolved once for theming
+        self.application = QApplication.instance()
+        
         # Initialize theme and styling
         self.theme = GlassTheme()
         self.animation_manager = AnimationManager()
         self.modern_styles = ModernStyles(self.theme)
         
-        # Initialize backend agent
-        self.gui_agent = ConfigoGUIAgent()
+        # Resolve the window stylesheet once; panels are styled by object name
+        self.complete_qss = self.modern_styles.get_complete_stylesheet()
+        self.text_primary_name = self.theme.colors['text_primary'].name()
+        
+        # Console screen used by the log handler, resolved on the first message
+        self.console_screen: Optional[LogConsoleWidget] = None
+        
+        # Status bar text is applied at most once per frame; while an
+        # installation runs only its final state is shown
+        self.pending_status: Optional[str] = None
+        self.installing = False
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(STATUS_UPDATE_INTERVAL_MS)
+        self.status_timer.timeout.connect(self.flush_status)
+        
+        # Last error shown in a modal, so repeats of it are not shown again
+        self.last_error_message: Optional[str] = None
+        
+        # Hides the progress bar a moment after an installation finishes
+        self.progress_hide_timer = QTimer(self)
+        self.progress_hide_timer.setSingleShot(True)
+        self.progress_hide_timer.timeout.connect(self.hide_progress)
+        
+        # Error modal is built on the first error and reused afterwards
+        self.error_modal: Optional[QDialog] = None
         
-        # Setup UI
-        self.setup_ui()
-        self.setup_connections()
-        self.setup_animations()
-        self.apply_modern_styling()
+        # Initialize backend agent on its own thread so backend calls don't
+        # block the GUI; its signals reach the window as queued connections
+        self.gui_agent = ConfigoGUIAgent()
+        self.agent_thread = QThread(self)
+        self.gui_agent.moveToThread(self.agent_thread)
+        self.setup_requested.connect(self.gui_agent.setup_environment, Qt.QueuedConnection)
+        
+        # Shutdown state: cleanup runs on the agent thread and the window
+        # closes once that thread has finished
+        self.closing = False
+        self.cleanup_done = False
+        self.agent_cleanup = AgentCleanup(self.gui_agent)
+        self.agent_cleanup.moveToThread(self.agent_thread)
+        self.cleanup_requested.connect(self.agent_cleanup.run, Qt.QueuedConnection)
+        self.agent_thread.finished.connect(self.on_cleanup_finished, Qt.QueuedConnection)
+        
+        # Setup UI; the window paints once when construction is complete
+        with RedrawGuard(self):
+            self.setup_ui()
+            self.setup_connections()
+            self.setup_animations()
+            self.apply_modern_styling()
         
         # Show welcome screen with animation
         self.show_welcome_screen()
+        
+        # Start the agent thread only once the window is fully constructed.
+        # Bind the thread itself, not a method of this window, so it is still
+        # stopped if the window is destroyed without being closed
+        self.destroyed.connect(partial(stop_thread, self.agent_thread))
+        self.agent_thread.start()
     
     def setup_ui(self):
         """Initialize the modern main window UI components."""
         # Set window properties
         self.setWindowTitle("CONFIGO - AI Setup Agent")
+        self.setObjectName("ModernMainWindow")
         self.setMinimumSize(1200, 800)
         self.resize(1400, 900)
         
-        # Enable window transparency for glass effect
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        
         # Create central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -139,10 +268,7 @@ class ModernMainWindow(QMainWindow):
         # Create sidebar container
         self.sidebar = QFrame()
         self.sidebar.setFixedWidth(280)
-        self.sidebar.setStyleSheet(self.modern_styles.get_sidebar_style())
-        
-        # Apply glass effect to sidebar
-        self.theme.apply_glass_effect_to_widget(self.sidebar)
+        self.sidebar.setObjectName("Sidebar")
         
         # Create sidebar layout
         sidebar_layout = QVBoxLayout(self.sidebar)
@@ -160,33 +286,28 @@ class ModernMainWindow(QMainWindow):
         
         title_label = QLabel("CONFIGO")
         title_label.setFont(self.theme.fonts['heading_small'])
-        title_label.setStyleSheet(f"color: {self.theme.colors['text_primary'].name()};")
+        title_label.setStyleSheet(f"color: {self.text_primary_name};")
         logo_layout.addWidget(title_label)
         
         sidebar_layout.addLayout(logo_layout)
         sidebar_layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
         
-        # Navigation buttons
+        # Navigation buttons; one exclusive group dispatches all clicks. The
+        # sidebar is flush with the window edge, so the buttons skip the glow
+        # shadow effect
         self.nav_buttons = {}
-        nav_items = [
-            ("🏠", "Welcome", "welcome"),
-            ("⚙️", "Environment", "environment"),
-            ("📋", "Plan", "plan"),
-            ("🖥️", "Console", "console"),
-            ("🌐", "Portals", "portals"),
-            ("💾", "Memory", "memory"),
-            ("🤖", "AI Assistant", "ai_assistant"),
-            ("🔮", "Predictions", "predictions"),
-            ("⚡", "Terminal", "terminal")
-        ]
-        
-        for icon, text, screen_id in nav_items:
-            button = AnimatedButton(f"{icon} {text}", variant="ghost", theme=self.theme)
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        
+        for nav_id, (screen_id, label) in enumerate(NAV_ITEMS):
+            button = AnimatedButton(label, variant="ghost", theme=self.theme, glow=False)
             button.setCheckable(True)
-            button.clicked.connect(lambda checked, sid=screen_id: self.navigate_to_screen(sid))
+            self.nav_group.addButton(button, nav_id)
             self.nav_buttons[screen_id] = button
             sidebar_layout.addWidget(button)
         
+        self.nav_group.idClicked.connect(self.on_nav_clicked)
+        
         # Set welcome as active
         self.nav_buttons["welcome"].setChecked(True)
         
@@ -199,16 +320,7 @@ class ModernMainWindow(QMainWindow):
         """Setup main content area with glass effect."""
         # Create main content container
         self.content_container = QFrame()
-        self.content_container.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 0.05);
-                border-radius: 16px;
-                margin: 16px;
-            }
-        """)
-        
-        # Apply glass effect
-        self.theme.apply_glass_effect_to_widget(self.content_container)
+        self.content_container.setObjectName("ContentContainer")
         
         # Create content layout
         content_layout = QVBoxLayout(self.content_container)
@@ -224,58 +336,30 @@ class ModernMainWindow(QMainWindow):
     def setup_stacked_widget(self, content_layout):
         """Setup stacked widget for different screens."""
         self.stacked_widget = QStackedWidget()
-        self.stacked_widget.setStyleSheet("""
-            QStackedWidget {
-                background: transparent;
-            }
-        """)
+        self.stacked_widget.setObjectName("ContentStack")
         
-        # Create screens
+        # Screens are created on first navigation; only welcome is built up front
         self.screens = {}
-        
-        # Welcome screen
-        self.screens["welcome"] = WelcomeScreen()
-        self.stacked_widget.addWidget(self.screens["welcome"])
-        
-        # Environment setup screen
-        self.screens["environment"] = EnvironmentSetupScreen()
-        self.stacked_widget.addWidget(self.screens["environment"])
-        
-        # Plan renderer screen
-        self.screens["plan"] = PlanRendererScreen()
-        self.stacked_widget.addWidget(self.screens["plan"])
-        
-        # Log console screen
-        self.screens["console"] = LogConsoleWidget()
-        self.stacked_widget.addWidget(self.screens["console"])
-        
-        # Portal integration screen
-        self.screens["portals"] = PortalIntegrationWidget()
-        self.stacked_widget.addWidget(self.screens["portals"])
-        
-        # Memory view screen
-        self.screens["memory"] = MemoryViewWidget()
-        self.stacked_widget.addWidget(self.screens["memory"])
-        
-        # AI Assistant screen
-        self.screens["ai_assistant"] = AIAssistantPanel()
-        self.stacked_widget.addWidget(self.screens["ai_assistant"])
-        
-        # Predictive suggestions screen
-        self.screens["predictions"] = PredictiveSuggestionsPanel()
-        self.stacked_widget.addWidget(self.screens["predictions"])
-        
-        # Enhanced terminal screen
-        self.screens["terminal"] = EnhancedTerminalConsole()
-        self.stacked_widget.addWidget(self.screens["terminal"])
+        self.get_screen("welcome")
         
         content_layout.addWidget(self.stacked_widget)
     
+    def get_screen(self, screen_id: str) -> QWidget:
+        """Return the screen for screen_id, creating and wiring it on first access."""
+        screen = self.screens.get(screen_id)
+        if screen is None:
+            factory, wiring = SCREEN_SPECS[screen_id]
+            screen = factory()
+            for signal_name, slot_name in wiring:
+                getattr(screen, signal_name).connect(getattr(self, slot_name))
+            self.stacked_widget.addWidget(screen)
+            self.screens[screen_id] = screen
+        return screen
+    
     def setup_status_bar(self):
         """Setup modern status bar."""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.setStyleSheet(self.modern_styles.get_status_bar_style())
         
         # Status indicators
         self.status_label = QLabel("Ready")
@@ -283,71 +367,81 @@ class ModernMainWindow(QMainWindow):
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet(self.modern_styles.get_progress_bar_style())
         self.status_bar.addPermanentWidget(self.progress_bar)
     
     def setup_connections(self):
         """Setup signal connections."""
         # Connect backend signals
-        self.gui_agent.environment_requested.connect(self.on_environment_requested)
         self.gui_agent.plan_generated.connect(self.on_plan_generated)
-        self.gui_agent.installation_started.connect(self.on_installation_started)
+        self.gui_agent.installation_progress.connect(self.on_installation_progress)
         self.gui_agent.installation_finished.connect(self.on_installation_finished)
-        self.gui_agent.log_updated.connect(self.on_log_message)
+        self.gui_agent.log_message.connect(self.on_log_message)
         self.gui_agent.error_occurred.connect(self.on_error_occurred)
-        
-        # Connect screen signals
-        for screen_id, screen in self.screens.items():
-            if hasattr(screen, 'environment_requested'):
-                screen.environment_requested.connect(self.on_environment_requested)
-            if hasattr(screen, 'plan_generated'):
-                screen.plan_generated.connect(self.on_plan_generated)
     
     def setup_animations(self):
         """Setup window animations."""
         # Window fade-in animation
         self.fade_in_animation = self.animation_manager.create_fade_animation(
-            self, start_opacity=0.0, end_opacity=1.0, duration=500
+            self, start_opacity=0.0, end_opacity=1.0, duration=500,
+            target_fps=CHROME_ANIMATION_FPS
         )
+        self.fade_in_animation.finished.connect(self.on_fade_in_finished)
         self.fade_in_animation.start()
     
+    def on_fade_in_finished(self):
+        """Drop the opacity effect so the window stops rendering offscreen."""
+        self.setGraphicsEffect(None)
+    
     def apply_modern_styling(self):
         """Apply complete modern styling to the window."""
         # Apply theme to application
-        self.theme.apply_theme_to_app(self.app())
-        
-        # Set complete stylesheet
-        self.setStyleSheet(self.modern_styles.get_complete_stylesheet())
+        self.theme.apply_theme_to_app(self.application)
         
-        # Apply shadow effects
-        self.modern_styles.apply_shadow_effect(self.content_container)
+        # Set complete stylesheet; it also provides the window's background
+        # gradient, which Qt fills without a custom paintEvent
+        self.setStyleSheet(self.complete_qss)
     
     def navigate_to_screen(self, screen_id: str):
         """Navigate to a specific screen with animation."""
-        if screen_id not in self.screens:
+        if screen_id not in SCREEN_SPECS:
             return
         
-        # Update navigation buttons
-        for button_id, button in self.nav_buttons.items():
-            button.setChecked(button_id == screen_id)
+        # Update navigation buttons; the exclusive group unchecks the rest
+        self.nav_buttons[screen_id].setChecked(True)
         
         # Get current and target screens
         current_screen = self.stacked_widget.currentWidget()
-        target_screen = self.screens[screen_id]
+        target_screen = self.get_screen(screen_id)
         
-        # Create transition animation
-        transition = self.animation_manager.create_screen_transition(
-            current_screen, target_screen, direction="slide_right"
-        )
-        
-        # Switch screens
-        self.stacked_widget.setCurrentWidget(target_screen)
-        
-        # Start transition animation
-        transition.start()
+        # Switch screens; no transition while installing, to keep the GUI
+        # thread free for installation output, or when staying on this screen
+        if self.installing or current_screen is target_screen:
+            self.stacked_widget.setCurrentWidget(target_screen)
+        else:
+            transition = self.animation_manager.get_screen_transition(
+                current_screen, target_screen, direction="slide_right"
+            )
+            self.stacked_widget.setCurrentWidget(target_screen)
+            transition.start()
         
         # Update status
-        self.status_label.setText(f"Viewing {screen_id.replace('_', ' ').title()}")
+        self.queue_status(f"Viewing {screen_id.replace('_', ' ').title()}")
+    
+    def queue_status(self, text: str):
+        """Schedule a status bar update, keeping only the latest text."""
+        self.pending_status = text
+        if not self.installing and not self.status_timer.isActive():
+            self.status_timer.start()
+    
+    def flush_status(self):
+        """Apply the most recent pending status text."""
+        if self.pending_status is not None:
+            self.status_label.setText(self.pending_status)
+            self.pending_status = None
+    
+    def on_nav_clicked(self, nav_id: int):
+        """Handle a click on a sidebar navigation button."""
+        self.navigate_to_screen(NAV_SCREEN_IDS[nav_id])
     
     def show_welcome_screen(self):
         """Show welcome screen with animation."""
@@ -355,107 +449,142 @@ class ModernMainWindow(QMainWindow):
     
     def on_environment_requested(self, environment: str):
         """Handle environment setup request."""
-        self.status_label.setText(f"Setting up {environment} environment...")
+        self.queue_status(f"Setting up {environment} environment...")
+        self.progress_hide_timer.stop()
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         
         # Navigate to environment screen
         self.navigate_to_screen("environment")
         
-        # Start backend process
-        self.gui_agent.setup_environment(environment)
+        # Start backend process on the agent thread
+        self.setup_requested.emit(environment)
     
     def on_plan_generated(self, plan: list):
         """Handle plan generation."""
-        self.status_label.setText("Plan generated successfully")
+        self.queue_status("Plan generated successfully")
         self.progress_bar.setVisible(False)
         
         # Navigate to plan screen
         self.navigate_to_screen("plan")
         
-        # Update plan screen
-        if "plan" in self.screens:
-            self.screens["plan"].update_plan(plan)
+        # Update plan screen, repainting once after all tool cards are added
+        plan_screen = self.screens["plan"]
+        with RedrawGuard(plan_screen):
+            plan_screen.update_plan(plan)
     
-    def on_installation_started(self):
-        """Handle installation start."""
-        self.status_label.setText("Installation in progress...")
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
+    def on_installation_progress(self, step: int, total: int, message: str):
+        """Handle installation progress updates."""
+        # The first progress update marks the start of the installation
+        if not self.installing:
+            self.queue_status("Installation in progress...")
+            self.flush_status()
+            self.installing = True
+            self.progress_hide_timer.stop()
+            self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(int(step * 100 / total) if total else 0)
+        self.get_screen("plan").update_progress(step, total, message)
     
     def on_installation_finished(self, success: bool, message: str):
         """Handle installation completion."""
+        self.installing = False
         if success:
-            self.status_label.setText("Installation completed successfully")
+            self.queue_status("Installation completed successfully")
             self.progress_bar.setValue(100)
         else:
-            self.status_label.setText(f"Installation failed: {message}")
+            self.queue_status(f"Installation failed: {message}")
         
         # Hide progress bar after delay
-        QTimer.singleShot(2000, lambda: self.progress_bar.setVisible(False))
+        self.progress_hide_timer.start(2000)
+    
+    def hide_progress(self):
+        """Hide the progress bar once the finished state has been shown."""
+        self.progress_bar.setVisible(False)
     
     def on_log_message(self, message: str):
         """Handle log message updates."""
-        # Update console screen
-        if "console" in self.screens:
-            self.screens["console"].append_log(message)
+        # The console's ingest worker coalesces messages into batched inserts,
+        # so each line is only queued here; the screen is created on first use
+        # so early messages are kept
+        if self.console_screen is None:
+            self.console_screen = self.get_screen("console")
+        self.console_screen.add_log_message(message)
     
     def on_error_occurred(self, error_message: str):
         """Handle error occurrences."""
-        self.status_label.setText(f"Error: {error_message}")
+        self.queue_status(f"Error: {error_message}")
         
-        # Show error modal
+        # Show error modal, skipping repeats of the error just shown
+        if error_message == self.last_error_message:
+            return
+        self.last_error_message = error_message
         self.show_error_modal(error_message)
     
-    def show_error_modal(self, error_message: str):
-        """Show modern error modal."""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QDialogButtonBox
-        
-        modal = QDialog(self)
-        modal.setWindowTitle("Error")
-        modal.setModal(True)
-        modal.setStyleSheet(self.modern_styles.get_modal_style())
+    def create_error_modal(self):
+        """Build the reusable error modal."""
+        self.error_modal = QDialog(self)
+        self.error_modal.setWindowTitle("Error")
+        self.error_modal.setModal(True)
+        self.error_modal.setObjectName("ModalDialog")
+        self.error_modal.finished.connect(self.on_error_modal_finished)
         
-        layout = QVBoxLayout(modal)
+        layout = QVBoxLayout(self.error_modal)
         
         # Error icon and message
         error_label = QLabel("❌ Error")
         error_label.setFont(self.theme.fonts['heading_small'])
         layout.addWidget(error_label)
         
-        message_label = QLabel(error_message)
-        message_label.setWordWrap(True)
-        layout.addWidget(message_label)
+        self.error_body_label = QLabel()
+        self.error_body_label.setWordWrap(True)
+        layout.addWidget(self.error_body_label)
         
         # Buttons
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
-        button_box.accepted.connect(modal.accept)
+        button_box.accepted.connect(self.error_modal.accept)
         layout.addWidget(button_box)
+    
+    def on_error_modal_finished(self):
+        """Allow the dismissed error to be shown again if it recurs."""
+        self.last_error_message = None
+    
+    def show_error_modal(self, error_message: str):
+        """Show modern error modal."""
+        if self.error_modal is None:
+            self.create_error_modal()
+        
+        # Errors arriving while the modal is open are added to it rather than
+        # stacking another modal on top
+        if self.error_modal.isVisible():
+            self.error_body_label.setText(f"{self.error_body_label.text()}\n{error_message}")
+            return
         
-        modal.exec()
+        self.error_body_label.setText(error_message)
+        self.error_modal.exec()
     
     def closeEvent(self, event):
         """Handle window close event."""
+        if self.cleanup_done:
+            event.accept()
+            return
+        
+        # Ignore repeated close requests while cleanup is running
+        event.ignore()
+        if self.closing:
+            return
+        self.closing = True
+        
         # Stop all animations
         self.animation_manager.stop_all_animations()
         
-        # Cleanup backend
-        if hasattr(self, 'gui_agent'):
-            self.gui_agent.cleanup()
-        
-        event.accept()
+        # Cleanup backend on the agent thread, after any running setup call,
+        # and close once the thread has stopped
+        self.status_timer.stop()
+        self.status_label.setText("Shutting down…")
+        self.cleanup_requested.emit()
     
-    def paintEvent(self, event):
-        """Custom paint event for enhanced glass effect."""
-        super().paintEvent(event)
-        
-        # Create custom painter for background effects
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Add subtle gradient background
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(15, 23, 42, 200))  # Slate 900 with alpha
-        gradient.setColorAt(1, QColor(30, 41, 59, 200))  # Slate 800 with alpha
-        
-        painter.fillRect(self.rect(), gradient) 
\ No newline at end of file
+    def on_cleanup_finished(self):
+        """Close the window once backend cleanup has completed."""
+        self.agent_thread.wait()
+        self.cleanup_done = True
+        self.close()
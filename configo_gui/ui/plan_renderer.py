@@ -19,6 +19,217 @@ from PySide6.QtCore import Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QFont, QIcon, QPixmap, QColor
 
 
+# Minimum interval between applied installer progress updates (~30 Hz)
+PROGRESS_UPDATE_INTERVAL_MS = 33
+
+# Plan renderer stylesheet, set on PlanRendererScreen and inherited by its tool
+# cards, so it is parsed once per screen instead of once per card
+PLAN_RENDERER_STYLESHEET = """
+    PlanRendererScreen, PlanRendererScreen QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    
+    PlanRendererScreen QGroupBox {
+        font-size: 16px;
+        font-weight: bold;
+        color: #ffffff;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    
+    PlanRendererScreen QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    
+    PlanRendererScreen #title-label {
+        font-size: 32px;
+        font-weight: bold;
+        color: #ffffff;
+        margin-bottom: 10px;
+    }
+    
+    PlanRendererScreen #subtitle-label {
+        font-size: 18px;
+        color: #cccccc;
+        margin-bottom: 20px;
+    }
+    
+    PlanRendererScreen #overview-label {
+        font-size: 14px;
+        color: #cccccc;
+        line-height: 1.5;
+    }
+    
+    PlanRendererScreen #progress-summary {
+        font-size: 12px;
+        color: #888888;
+        margin-top: 10px;
+    }
+    
+    PlanRendererScreen #tools-scroll {
+        background-color: transparent;
+        border: none;
+    }
+    
+    PlanRendererScreen #tools-container {
+        background-color: transparent;
+    }
+    
+    PlanRendererScreen #install-button {
+        background-color: #0066cc;
+        border: none;
+        border-radius: 25px;
+        color: #ffffff;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 15px 30px;
+        min-width: 200px;
+        min-height: 50px;
+    }
+    
+    PlanRendererScreen #install-button:hover {
+        background-color: #0077ee;
+    }
+    
+    PlanRendererScreen #install-button:pressed {
+        background-color: #0052a3;
+    }
+    
+    PlanRendererScreen #install-button:disabled {
+        background-color: #404040;
+        color: #888888;
+    }
+    
+    PlanRendererScreen #cancel-button {
+        background-color: #ff4444;
+        border: none;
+        border-radius: 25px;
+        color: #ffffff;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 15px 30px;
+        min-width: 120px;
+        min-height: 50px;
+    }
+    
+    PlanRendererScreen #cancel-button:hover {
+        background-color: #ff6666;
+    }
+    
+    PlanRendererScreen #cancel-button:pressed {
+        background-color: #cc3333;
+    }
+    
+    PlanRendererScreen #confirm-banner {
+        background-color: #1e1e1e;
+        border: 2px solid #0066cc;
+        border-radius: 8px;
+    }
+    
+    PlanRendererScreen #confirm-label {
+        background-color: transparent;
+        font-size: 14px;
+        color: #ffffff;
+    }
+    
+    PlanRendererScreen #confirm-yes-button, PlanRendererScreen #confirm-no-button {
+        background-color: #404040;
+        border: none;
+        border-radius: 6px;
+        color: #ffffff;
+        font-size: 14px;
+        padding: 8px 16px;
+    }
+    
+    PlanRendererScreen #confirm-yes-button {
+        background-color: #0066cc;
+    }
+    
+    PlanRendererScreen #confirm-yes-button:hover {
+        background-color: #0077ee;
+    }
+    
+    PlanRendererScreen #confirm-no-button:hover {
+        background-color: #505050;
+    }
+    
+    ToolCard, QWidget ToolCard, ToolCard QFrame {
+        background-color: #1e1e1e;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        margin: 5px;
+    }
+    
+    ToolCard:hover {
+        border-color: #0066cc;
+    }
+    
+    ToolCard #tool-name {
+        font-size: 16px;
+        font-weight: bold;
+        color: #ffffff;
+    }
+    
+    ToolCard #tool-status {
+        font-size: 12px;
+        color: #ffaa00;
+    }
+    
+    ToolCard #tool-status[state="installing"] {
+        color: #0066cc;
+    }
+    
+    ToolCard #tool-status[state="success"] {
+        color: #00cc00;
+    }
+    
+    ToolCard #tool-status[state="error"] {
+        color: #ff4444;
+    }
+    
+    ToolCard #tool-status[state="skipped"] {
+        color: #888888;
+    }
+    
+    ToolCard #tool-description {
+        font-size: 14px;
+        color: #cccccc;
+        line-height: 1.4;
+    }
+    
+    ToolCard #tool-dependencies {
+        font-size: 12px;
+        color: #888888;
+        font-style: italic;
+    }
+    
+    ToolCard #tool-command {
+        font-size: 12px;
+        color: #00cc00;
+        font-family: monospace;
+        background-color: #0a0a0a;
+        padding: 5px;
+        border-radius: 4px;
+    }
+    
+    ToolCard #tool-progress {
+        background-color: #404040;
+        border: none;
+        border-radius: 4px;
+    }
+    
+    ToolCard #tool-progress::chunk {
+        background-color: #0066cc;
+        border-radius: 4px;
+    }
+"""
+
+
 class ToolCard(QFrame):
     """
     Individual tool card component for displaying tool information.
@@ -30,11 +241,19 @@ class ToolCard(QFrame):
     - Status indicators
     """
     
+    # Status label text per status; colors come from the stylesheet
+    STATUS_TEXTS = {
+        'pending': '⏳ Pending',
+        'installing': '🔧 Installing',
+        'success': '✅ Installed',
+        'error': '❌ Failed',
+        'skipped': '⏭️ Skipped'
+    }
+    
     def __init__(self, tool_info: dict):
         super().__init__()
         self.tool_info = tool_info
         self.setup_ui()
-        self.setup_styling()
     
     def setup_ui(self):
         """Initialize the tool card UI components."""
@@ -47,118 +266,81 @@ class ToolCard(QFrame):
         header_layout = QHBoxLayout()
         
         # Tool name
-        self.name_label = QLabel(self.tool_info.get('name', 'Unknown Tool'))
+        self.name_label = QLabel()
         self.name_label.setObjectName("tool-name")
+        self.name_label.setTextFormat(Qt.PlainText)
         header_layout.addWidget(self.name_label)
         
         # Status indicator
-        self.status_label = QLabel("⏳ Pending")
+        self.status_label = QLabel(self.STATUS_TEXTS['pending'])
         self.status_label.setObjectName("tool-status")
+        self.status_label.setTextFormat(Qt.PlainText)
+        self.status_label.setProperty("state", 'pending')
         header_layout.addWidget(self.status_label)
         
         layout.addLayout(header_layout)
         
         # Description
-        self.desc_label = QLabel(self.tool_info.get('description', 'No description available'))
+        self.desc_label = QLabel()
         self.desc_label.setObjectName("tool-description")
+        self.desc_label.setTextFormat(Qt.PlainText)
         self.desc_label.setWordWrap(True)
         layout.addWidget(self.desc_label)
         
-        # Dependencies
-        dependencies = self.tool_info.get('dependencies', [])
-        if dependencies:
-            deps_label = QLabel(f"Dependencies: {', '.join(dependencies)}")
-            deps_label.setObjectName("tool-dependencies")
-            layout.addWidget(deps_label)
+        # Dependencies (hidden when the tool has none)
+        self.deps_label = QLabel()
+        self.deps_label.setObjectName("tool-dependencies")
+        self.deps_label.setTextFormat(Qt.PlainText)
+        layout.addWidget(self.deps_label)
         
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setObjectName("tool-progress")
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setTextVisible(False)  # the summary line shows the percentage
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
         
-        # Install command (collapsible)
+        # Install command (hidden when the tool has none)
+        self.cmd_label = QLabel()
+        self.cmd_label.setObjectName("tool-command")
+        self.cmd_label.setTextFormat(Qt.PlainText)
+        self.cmd_label.setWordWrap(True)
+        layout.addWidget(self.cmd_label)
+        
+        self.show_tool_info()
+    
+    def show_tool_info(self):
+        """Fill the labels from the current tool info."""
+        self.name_label.setText(self.tool_info.get('name', 'Unknown Tool'))
+        self.desc_label.setText(self.tool_info.get('description', 'No description available'))
+        
+        dependencies = self.tool_info.get('dependencies', [])
+        self.deps_label.setText(f"Dependencies: {', '.join(dependencies)}" if dependencies else "")
+        self.deps_label.setVisible(bool(dependencies))
+        
         install_cmd = self.tool_info.get('install_command', '')
-        if install_cmd:
-            self.cmd_label = QLabel(f"Command: {install_cmd}")
-            self.cmd_label.setObjectName("tool-command")
-            self.cmd_label.setWordWrap(True)
-            layout.addWidget(self.cmd_label)
+        self.cmd_label.setText(f"Command: {install_cmd}" if install_cmd else "")
+        self.cmd_label.setVisible(bool(install_cmd))
     
-    def setup_styling(self):
-        """Apply custom styling to the tool card."""
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e1e;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin: 5px;
-            }
-            
-            QFrame:hover {
-                border-color: #0066cc;
-            }
-            
-            #tool-name {
-                font-size: 16px;
-                font-weight: bold;
-                color: #ffffff;
-            }
-            
-            #tool-status {
-                font-size: 12px;
-                color: #ffaa00;
-            }
-            
-            #tool-description {
-                font-size: 14px;
-                color: #cccccc;
-                line-height: 1.4;
-            }
-            
-            #tool-dependencies {
-                font-size: 12px;
-                color: #888888;
-                font-style: italic;
-            }
-            
-            #tool-command {
-                font-size: 12px;
-                color: #00cc00;
-                font-family: monospace;
-                background-color: #0a0a0a;
-                padding: 5px;
-                border-radius: 4px;
-            }
-            
-            #tool-progress {
-                background-color: #404040;
-                border: none;
-                border-radius: 4px;
-                text-align: center;
-                color: #ffffff;
-            }
-            
-            #tool-progress::chunk {
-                background-color: #0066cc;
-                border-radius: 4px;
-            }
-        """)
+    def rebind(self, tool_info: dict):
+        """Show another tool on this card and reset its status."""
+        self.tool_info = tool_info
+        self.show_tool_info()
+        self.update_status('pending')
     
     def update_status(self, status: str, progress: int = 0):
         """Update the tool status and progress."""
-        status_colors = {
-            'pending': ('⏳ Pending', '#ffaa00'),
-            'installing': ('🔧 Installing', '#0066cc'),
-            'success': ('✅ Installed', '#00cc00'),
-            'error': ('❌ Failed', '#ff4444'),
-            'skipped': ('⏭️ Skipped', '#888888')
-        }
-        
-        if status in status_colors:
-            text, color = status_colors[status]
+        text = self.STATUS_TEXTS.get(status)
+        if text is not None and self.status_label.property("state") != status:
             self.status_label.setText(text)
-            self.status_label.setStyleSheet(f"color: {color};")
+            
+            # Color comes from the shared stylesheet's [state] rules; repolish
+            # only this label instead of parsing a new per-widget sheet
+            self.status_label.setProperty("state", status)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
         
         if progress > 0:
             self.progress_bar.setVisible(True)
@@ -187,6 +369,20 @@ class PlanRendererScreen(QWidget):
         super().__init__()
         self.plan = []
         self.tool_cards = {}
+        self.overview_text = "No plan generated yet"
+        
+        # Every card ever created, in layout order; cards past the current
+        # plan are hidden and rebound when a later plan needs them
+        self.card_list = []
+        
+        # Installer progress arrives in bursts; keep only the latest update and
+        # apply it at most once per interval
+        self.pending_progress = None
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setSingleShot(True)
+        self.progress_timer.setInterval(PROGRESS_UPDATE_INTERVAL_MS)
+        self.progress_timer.timeout.connect(self.flush_progress)
+        
         self.setup_ui()
         self.setup_styling()
     
@@ -222,12 +418,14 @@ class PlanRendererScreen(QWidget):
         # Title
         title_label = QLabel("Installation Plan")
         title_label.setObjectName("title-label")
+        title_label.setTextFormat(Qt.PlainText)
         title_label.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(title_label)
         
         # Subtitle
         subtitle_label = QLabel("Review and execute the installation plan")
         subtitle_label.setObjectName("subtitle-label")
+        subtitle_label.setTextFormat(Qt.PlainText)
         subtitle_label.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(subtitle_label)
         
@@ -245,12 +443,14 @@ class PlanRendererScreen(QWidget):
         # Overview info
         self.overview_label = QLabel("No plan generated yet")
         self.overview_label.setObjectName("overview-label")
+        self.overview_label.setTextFormat(Qt.PlainText)
         self.overview_label.setWordWrap(True)
         overview_layout.addWidget(self.overview_label)
         
         # Progress summary
         self.progress_summary = QLabel("")
         self.progress_summary.setObjectName("progress-summary")
+        self.progress_summary.setTextFormat(Qt.PlainText)
         overview_layout.addWidget(self.progress_summary)
         
         main_layout.addWidget(overview_group)
@@ -271,6 +471,7 @@ class PlanRendererScreen(QWidget):
         
         # Container widget for tool cards
         self.tools_container = QWidget()
+        self.tools_container.setObjectName("tools-container")
         self.tools_layout = QVBoxLayout(self.tools_container)
         self.tools_layout.setAlignment(Qt.AlignTop)
         
@@ -289,181 +490,138 @@ class PlanRendererScreen(QWidget):
         controls_layout = QHBoxLayout(controls_frame)
         controls_layout.setAlignment(Qt.AlignCenter)
         
-        # Install button
+        # Install button; the control buttons always emit in the GUI thread,
+        # so their slots are connected directly
         self.install_button = QPushButton("🚀 Start Installation")
         self.install_button.setObjectName("install-button")
         self.install_button.setMinimumSize(200, 50)
-        self.install_button.clicked.connect(self.on_install_clicked)
+        self.install_button.clicked.connect(self.on_install_clicked, Qt.DirectConnection)
         controls_layout.addWidget(self.install_button)
         
         # Cancel button
         self.cancel_button = QPushButton("❌ Cancel")
         self.cancel_button.setObjectName("cancel-button")
         self.cancel_button.setMinimumSize(120, 50)
-        self.cancel_button.clicked.connect(self.on_cancel_clicked)
+        self.cancel_button.clicked.connect(self.on_cancel_clicked, Qt.DirectConnection)
         controls_layout.addWidget(self.cancel_button)
         
+        # Inline install confirmation, shown instead of a modal dialog
+        self.confirm_banner = QFrame()
+        self.confirm_banner.setObjectName("confirm-banner")
+        self.confirm_banner.setVisible(False)
+        
+        banner_layout = QHBoxLayout(self.confirm_banner)
+        
+        self.confirm_label = QLabel()
+        self.confirm_label.setObjectName("confirm-label")
+        self.confirm_label.setTextFormat(Qt.PlainText)
+        banner_layout.addWidget(self.confirm_label)
+        banner_layout.addStretch()
+        
+        confirm_yes_button = QPushButton("Yes")
+        confirm_yes_button.setObjectName("confirm-yes-button")
+        confirm_yes_button.clicked.connect(self.on_confirm_install, Qt.DirectConnection)
+        banner_layout.addWidget(confirm_yes_button)
+        
+        confirm_no_button = QPushButton("No")
+        confirm_no_button.setObjectName("confirm-no-button")
+        confirm_no_button.clicked.connect(self.confirm_banner.hide, Qt.DirectConnection)
+        banner_layout.addWidget(confirm_no_button)
+        
+        main_layout.addWidget(self.confirm_banner)
         main_layout.addWidget(controls_frame)
     
     def setup_styling(self):
-        """Apply custom styling to the plan renderer screen."""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            
-            #title-label {
-                font-size: 32px;
-                font-weight: bold;
-                color: #ffffff;
-                margin-bottom: 10px;
-            }
-            
-            #subtitle-label {
-                font-size: 18px;
-                color: #cccccc;
-                margin-bottom: 20px;
-            }
-            
-            #overview-label {
-                font-size: 14px;
-                color: #cccccc;
-                line-height: 1.5;
-            }
-            
-            #progress-summary {
-                font-size: 12px;
-                color: #888888;
-                margin-top: 10px;
-            }
-            
-            #tools-scroll {
-                background-color: transparent;
-                border: none;
-            }
-            
-            #tools-scroll QWidget {
-                background-color: transparent;
-            }
-            
-            #install-button {
-                background-color: #0066cc;
-                border: none;
-                border-radius: 25px;
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px 30px;
-                min-width: 200px;
-                min-height: 50px;
-            }
-            
-            #install-button:hover {
-                background-color: #0077ee;
-            }
-            
-            #install-button:pressed {
-                background-color: #0052a3;
-            }
-            
-            #install-button:disabled {
-                background-color: #404040;
-                color: #888888;
-            }
-            
-            #cancel-button {
-                background-color: #ff4444;
-                border: none;
-                border-radius: 25px;
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px 30px;
-                min-width: 120px;
-                min-height: 50px;
-            }
-            
-            #cancel-button:hover {
-                background-color: #ff6666;
-            }
-            
-            #cancel-button:pressed {
-                background-color: #cc3333;
-            }
-        """)
+        """Apply custom styling to the plan renderer screen and its tool cards."""
+        self.setStyleSheet(PLAN_RENDERER_STYLESHEET)
     
     def update_plan(self, plan: list):
         """Update the installation plan."""
         self.plan = plan
+        self.pending_progress = None
+        self.confirm_banner.hide()
+        self.overview_text = self.build_overview_text()
         self.clear_tools()
         self.create_tool_cards()
         self.update_overview()
     
     def clear_tools(self):
-        """Clear all tool cards."""
-        for card in self.tool_cards.values():
-            self.tools_layout.removeWidget(card)
-            card.deleteLater()
+        """Hide all tool cards, keeping them for reuse."""
+        for card in self.card_list:
+            card.hide()
         self.tool_cards.clear()
     
     def create_tool_cards(self):
         """Create tool cards for each item in the plan."""
+        # Add all cards while the container is hidden and frozen so the
+        # scroll area is laid out and repainted once, not once per card
+        self.tools_container.setUpdatesEnabled(False)
+        self.tools_container.hide()
+        self.tools_layout.setEnabled(False)
+        
         for i, tool_info in enumerate(self.plan):
-            card = ToolCard(tool_info)
+            if i < len(self.card_list):
+                # Reuse an existing card instead of building new widgets
+                card = self.card_list[i]
+                card.rebind(tool_info)
+                card.show()
+            else:
+                card = ToolCard(tool_info)
+                self.card_list.append(card)
+                self.tools_layout.addWidget(card)
             self.tool_cards[tool_info.get('name', f'tool_{i}')] = card
-            self.tools_layout.addWidget(card)
+        
+        self.tools_layout.setEnabled(True)
+        self.tools_container.show()
+        self.tools_container.setUpdatesEnabled(True)
+        self.tools_layout.activate()
+    
+    def build_overview_text(self) -> str:
+        """Build the overview text for the current plan."""
+        if not self.plan:
+            return "No plan generated yet"
+        
+        return (
+            f"Plan includes {len(self.plan)} tools to install:\n"
+            f"• {' • '.join(tool.get('name', 'Unknown') for tool in self.plan)}"
+        )
     
     def update_overview(self):
         """Update the plan overview."""
+        # The text is built once per plan in update_plan
+        self.overview_label.setText(self.overview_text)
+        
         if not self.plan:
-            self.overview_label.setText("No plan generated yet")
             self.progress_summary.setText("")
             return
         
-        total_tools = len(self.plan)
-        self.overview_label.setText(
-            f"Plan includes {total_tools} tools to install:\n"
-            f"• {' • '.join([tool.get('name', 'Unknown') for tool in self.plan])}"
-        )
-        
-        self.progress_summary.setText(f"Total tools: {total_tools}")
+        self.progress_summary.setText(f"Total tools: {len(self.plan)}")
     
     def update_progress(self, step: int, total: int, message: str):
-        """Update installation progress."""
+        """Schedule an installation progress update, keeping only the latest."""
         if step <= 0 or total <= 0:
             return
         
+        self.pending_progress = (step, total, message)
+        if not self.progress_timer.isActive():
+            self.progress_timer.start()
+    
+    def flush_progress(self):
+        """Apply the most recent pending installation progress."""
+        if self.pending_progress is None:
+            return
+        step, total, message = self.pending_progress
+        self.pending_progress = None
+        
         # Update overall progress
         progress_percent = int((step / total) * 100)
         self.progress_summary.setText(
             f"Progress: {step}/{total} ({progress_percent}%) - {message}"
         )
         
-        # Update individual tool cards
+        # Update the current tool's card; card_list follows plan order
         if step <= len(self.plan):
-            current_tool = self.plan[step - 1]
-            tool_name = current_tool.get('name', f'tool_{step}')
-            
-            if tool_name in self.tool_cards:
-                card = self.tool_cards[tool_name]
-                card.update_status('installing', progress_percent)
+            self.card_list[step - 1].update_status('installing', progress_percent)
     
     def on_install_clicked(self):
         """Handle install button click."""
@@ -471,22 +629,22 @@ class PlanRendererScreen(QWidget):
             QMessageBox.warning(self, "No Plan", "No installation plan available.")
             return
         
-        # Confirm installation
-        reply = QMessageBox.question(
-            self, 
-            "Confirm Installation", 
-            f"Are you sure you want to install {len(self.plan)} tools?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            self.install_button.setEnabled(False)
-            self.install_button.setText("🔧 Installing...")
-            self.install_requested.emit()
+        # Ask for confirmation inline; the Yes button starts the install
+        self.confirm_label.setText(f"Are you sure you want to install {len(self.plan)} tools?")
+        self.confirm_banner.show()
+    
+    def on_confirm_install(self):
+        """Handle confirmation of the installation."""
+        self.confirm_banner.hide()
+        self.install_button.setEnabled(False)
+        self.install_button.setText("🔧 Installing...")
+        self.install_requested.emit()
     
     def on_cancel_clicked(self):
         """Handle cancel button click."""
+        self.flush_progress()
+        self.confirm_banner.hide()
+        
         # Reset UI state
         self.install_button.setEnabled(True)
         self.install_button.setText("🚀 Start Installation")
@@ -499,6 +657,8 @@ class PlanRendererScreen(QWidget):
     
     def on_installation_complete(self, success: bool, message: str):
         """Handle installation completion."""
+        self.flush_progress()
+        
         self.install_button.setEnabled(True)
         self.install_button.setText("🚀 Start Installation")
         
@@ -513,6 +673,9 @@ class PlanRendererScreen(QWidget):
     
     def on_tool_installed(self, tool_name: str, success: bool):
         """Handle individual tool installation completion."""
+        # Apply queued progress first so it cannot overwrite this result
+        self.flush_progress()
+        
         if tool_name in self.tool_cards:
             card = self.tool_cards[tool_name]
             if success:
@@ -18,6 +18,36 @@ from PySide6.QtWidgets import QWidget, QGraphicsOpacityEffect, QGraphicsDropShad
 from PySide6.QtGui import QColor
 
 
+# Frame rate for decorative animations (fades, screen slides); half the
+# display rate looks the same for chrome but halves the repaints
+CHROME_ANIMATION_FPS = 30
+
+
+class FrameCappedAnimation(QPropertyAnimation):
+    """
+    Property animation that updates its target at most target_fps times a second.
+    
+    Qt drives every animation from one global ~60 Hz timer; ticks that fall
+    inside the current frame are skipped so the target property, and the
+    repaint it triggers, only change once per frame. The final value is
+    always applied.
+    """
+    
+    def __init__(self, target, property_name: bytes, target_fps: int = CHROME_ANIMATION_FPS):
+        super().__init__(target, property_name)
+        self.frame_interval = max(1, 1000 // target_fps)
+        self.last_frame = -1
+    
+    def updateCurrentTime(self, current_time: int):
+        frame = current_time // self.frame_interval
+        if frame < self.last_frame:
+            # Restarted or rewound
+            self.last_frame = -1
+        if frame != self.last_frame or current_time >= self.duration():
+            self.last_frame = frame
+            super().updateCurrentTime(current_time)
+
+
 class AnimationManager:
     """
     Advanced animation manager for modern UI effects.
@@ -35,8 +65,24 @@ class AnimationManager:
         self.active_animations = {}
         self.animation_groups = {}
         
+        # Reusable slide transition: the old screen slides out as the new one slides in
+        self.transition_out = self.create_pooled_slide()
+        self.transition_in = self.create_pooled_slide()
+        self.screen_transition = QParallelAnimationGroup()
+        self.screen_transition.addAnimation(self.transition_out)
+        self.screen_transition.addAnimation(self.transition_in)
+    
+    def create_pooled_slide(self, duration: int = 300,
+                            target_fps: int = CHROME_ANIMATION_FPS) -> QPropertyAnimation:
+        """Create a target-less position animation for reuse across transitions."""
+        animation = FrameCappedAnimation(None, b"pos", target_fps)
+        animation.setDuration(duration)
+        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        return animation
+        
     def create_fade_animation(self, widget: QWidget, start_opacity: float = 0.0, 
-                            end_opacity: float = 1.0, duration: int = 300) -> QPropertyAnimation:
+                            end_opacity: float = 1.0, duration: int = 300,
+                            target_fps: int = CHROME_ANIMATION_FPS) -> QPropertyAnimation:
         """
         Create a fade in/out animation for a widget.
         
@@ -45,6 +91,7 @@ class AnimationManager:
             start_opacity: Starting opacity (0.0 to 1.0)
             end_opacity: Ending opacity (0.0 to 1.0)
             duration: Animation duration in milliseconds
+            target_fps: Maximum number of opacity updates per second
             
         Returns:
             QPropertyAnimation instance
@@ -55,7 +102,7 @@ class AnimationManager:
             widget.setGraphicsEffect(opacity_effect)
         
         # Create animation
-        animation = QPropertyAnimation(widget.graphicsEffect(), b"opacity")
+        animation = FrameCappedAnimation(widget.graphicsEffect(), b"opacity", target_fps)
         animation.setStartValue(start_opacity)
         animation.setEndValue(end_opacity)
         animation.setDuration(duration)
@@ -318,6 +365,42 @@ class AnimationManager:
         
         return QSequentialAnimationGroup()
     
+    def get_screen_transition(self, old_widget: QWidget, new_widget: QWidget,
+                              direction: str = "slide_right") -> QParallelAnimationGroup:
+        """
+        Get the shared slide transition, retargeted to the given screens.
+        
+        Unlike create_screen_transition, no animation objects are allocated;
+        a transition still running is stopped and reused. Both screens slide
+        relative to their parent's content origin, so a screen left offset by
+        an earlier transition still comes to rest in place.
+        
+        Args:
+            old_widget: Widget to animate out
+            new_widget: Widget to animate in
+            direction: Transition direction ("slide_right", "slide_left")
+            
+        Returns:
+            QParallelAnimationGroup instance
+        """
+        self.screen_transition.stop()
+        
+        # slide_right moves the old screen out to the left and brings the new
+        # one in from the right; slide_left mirrors it
+        sign = -1 if direction == "slide_left" else 1
+        parent = new_widget.parentWidget()
+        rest = parent.contentsRect().topLeft() if parent is not None else new_widget.pos()
+        
+        self.transition_out.setTargetObject(old_widget)
+        self.transition_out.setStartValue(rest)
+        self.transition_out.setEndValue(QPoint(rest.x() - sign * old_widget.width(), rest.y()))
+        
+        self.transition_in.setTargetObject(new_widget)
+        self.transition_in.setStartValue(QPoint(rest.x() + sign * new_widget.width(), rest.y()))
+        self.transition_in.setEndValue(rest)
+        
+        return self.screen_transition
+    
     def create_typing_animation(self, text_widget: QWidget, text: str, 
                               speed: int = 50) -> QTimer:
         """
@@ -415,6 +498,8 @@ class AnimationManager:
     
     def stop_all_animations(self):
         """Stop all active animations."""
+        self.screen_transition.stop()
+        
         for animation in self.active_animations.values():
             if animation.isRunning():
                 animation.stop()
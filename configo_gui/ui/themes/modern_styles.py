@@ -8,12 +8,26 @@ Provides glassmorphism effects, modern layouts, and responsive design.
 Author: CONFIGO Team
 """
 
+from functools import wraps
 from typing import Dict, Any, Optional
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QFont
 from PySide6.QtWidgets import QWidget, QGraphicsDropShadowEffect, QGraphicsBlurEffect
 
 
+def cached_style(method):
+    """Memoize a stylesheet builder on the ModernStyles instance."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return self.style_cache[key]
+        except KeyError:
+            style = self.style_cache[key] = method(self, *args, **kwargs)
+            return style
+    return wrapper
+
+
 class ModernStyles:
     """
     Modern styling system for CONFIGO GUI components.
@@ -31,7 +45,11 @@ class ModernStyles:
         self.colors = theme.colors
         self.fonts = theme.fonts
         self.effects = theme.effects
+        
+        # Stylesheet strings are built once per (method, arguments)
+        self.style_cache: Dict[tuple, str] = {}
     
+    @cached_style
     def get_glass_card_style(self, border_radius: int = None, padding: int = 16) -> str:
         """
         Get glassmorphism card styling.
@@ -62,6 +80,7 @@ class ModernStyles:
             }}
         """
     
+    @cached_style
     def get_modern_button_style(self, variant: str = "primary", size: str = "medium") -> str:
         """
         Get modern button styling.
@@ -181,6 +200,7 @@ class ModernStyles:
         
         return ""
     
+    @cached_style
     def get_modern_input_style(self, variant: str = "default") -> str:
         """
         Get modern input styling.
@@ -257,6 +277,7 @@ class ModernStyles:
         
         return ""
     
+    @cached_style
     def get_sidebar_style(self) -> str:
         """
         Get modern sidebar styling.
@@ -293,6 +314,7 @@ class ModernStyles:
             }}
         """
     
+    @cached_style
     def get_navigation_style(self) -> str:
         """
         Get modern navigation styling.
@@ -328,6 +350,7 @@ class ModernStyles:
             }}
         """
     
+    @cached_style
     def get_status_bar_style(self) -> str:
         """
         Get modern status bar styling.
@@ -345,6 +368,7 @@ class ModernStyles:
             }}
         """
     
+    @cached_style
     def get_progress_bar_style(self) -> str:
         """
         Get modern progress bar styling.
@@ -371,6 +395,7 @@ class ModernStyles:
             }}
         """
     
+    @cached_style
     def get_tooltip_style(self) -> str:
         """
         Get modern tooltip styling.
@@ -389,6 +414,7 @@ class ModernStyles:
             }}
         """
     
+    @cached_style
     def get_modal_style(self) -> str:
         """
         Get modern modal styling.
@@ -428,6 +454,7 @@ class ModernStyles:
             }}
         """
     
+    @cached_style
     def get_scrollbar_style(self) -> str:
         """
         Get modern scrollbar styling.
@@ -513,12 +540,74 @@ class ModernStyles:
         if color is None:
             color = QColor(0, 0, 0, 50)
         
-        shadow_effect = QGraphicsDropShadowEffect()
+        # Parent the effect to the widget so it isn't garbage collected
+        shadow_effect = QGraphicsDropShadowEffect(widget)
         shadow_effect.setBlurRadius(blur_radius)
         shadow_effect.setColor(color)
         shadow_effect.setOffset(offset, offset)
         widget.setGraphicsEffect(shadow_effect)
     
+    @cached_style
+    def get_object_styles(self) -> str:
+        """
+        Get styling for the main window panels, keyed by object name.
+        
+        Returns:
+            CSS stylesheet string
+        """
+        return f"""
+            QMainWindow#ModernMainWindow {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 rgba(15, 23, 42, 200),
+                    stop:1 rgba(30, 41, 59, 200));
+            }}
+            
+            QFrame#Sidebar {{
+                background-color: rgba(0, 0, 0, 0.3);
+                border-right: 1px solid rgba(255, 255, 255, 0.1);
+            }}
+            
+            QFrame#Sidebar QPushButton {{
+                background: transparent;
+                border: none;
+                border-radius: 8px;
+                color: {self.colors['text_secondary'].name()};
+                font: {self.fonts['body_medium'].pointSize()}pt "{self.fonts['inter']}";
+                font-weight: 500;
+                padding: 12px 16px;
+                text-align: left;
+                margin: 4px 8px;
+            }}
+            
+            QFrame#Sidebar QPushButton:hover {{
+                background-color: rgba(255, 255, 255, 0.1);
+                color: {self.colors['text_primary'].name()};
+            }}
+            
+            QFrame#Sidebar QPushButton:checked {{
+                background-color: {self.colors['primary'].name()};
+                color: white;
+            }}
+            
+            QFrame#ContentContainer {{
+                background-color: rgba(255, 255, 255, 0.05);
+                border: 1px solid rgba(255, 255, 255, 0.1);
+                border-radius: 16px;
+                margin: 16px;
+            }}
+            
+            QStackedWidget#ContentStack {{
+                background: transparent;
+            }}
+            
+            QDialog#ModalDialog {{
+                background-color: rgba(15, 23, 42, 0.95);
+                border: 1px solid rgba(255, 255, 255, 0.2);
+                border-radius: {self.effects['border_radius']}px;
+            }}
+        """
+    
+    @cached_style
     def get_complete_stylesheet(self) -> str:
         """
         Get complete application stylesheet.
@@ -536,4 +625,5 @@ class ModernStyles:
             {self.get_tooltip_style()}
             {self.get_modal_style()}
             {self.get_scrollbar_style()}
+            {self.get_object_styles()}
         """ 
\ No newline at end of file